@@ -36,6 +36,7 @@ import re
 import sys
 from typing import Any, Callable
 import wx
+from wx.lib.expando import ExpandoTextCtrl
 import wx.lib.mixins.listctrl as listmix
 
 from gui import guiHelper, nvdaControls, _isDebug
@@ -64,6 +65,11 @@ else:
 
 addonHandler.initTranslation()
 
+# Translators: The displayed value of a yes/no field
+_YES = _("Yes")
+# Translators: The displayed value of a yes/no field
+_NO = _("No")
+
 LABEL_ACCEL = re.compile("&(?!&)")
 """
 Compiled pattern used to strip accelerator key indicators from labels.
@@ -88,6 +94,20 @@ def stripAccelAndColon(label):
 	return stripAccel(label).rstrip(":").rstrip()
 
 
+def updateTextValue(ctrl: wx.TextCtrl, value: str) -> None:
+	"""Update the value of a text control, only if it changed.
+	
+	`ExpandoTextCtrl` handles `EVT_TEXT` to adjust its height: `ChangeValue`, which does not
+	emit it, is used only for other text controls.
+	"""
+	if ctrl.Value == value:
+		return
+	if isinstance(ctrl, ExpandoTextCtrl):
+		ctrl.Value = value
+	else:
+		ctrl.ChangeValue(value)
+
+
 def stripAngleBrackets(value):
 	"""Strip the eventual angle-brackets surrounding a display value
 	
@@ -153,8 +173,10 @@ class CustomTreeCtrl(wx.TreeCtrl):
 			newParent = self.AppendItem(parent if parent else self.RootItem, categoryClassInfo.title)
 			categoryClassInfo.updateTreeParams(self, newParent, parent)
 			self.setTreeNodeInfo(newParent, categoryClassInfo)
-			if categoryClassInfo.children:
-				self.addToListCtrl(categoryClassInfo.children, newParent)
+			# Each access to `children` calls the getter, which rebuilds the nodes
+			children = categoryClassInfo.children
+			if children:
+				self.addToListCtrl(children, newParent)
 
 
 class ListCtrlAccessible(wx.Accessible):
@@ -245,6 +267,11 @@ class FillableSettingsPanel(SettingsPanel, ScalingMixin):
 		self.mainSizer.Fit(self)
 		self.SetSizer(self.mainSizer)
 
+	def onLayoutNeeded(self, evt):
+		"""Handler for `EVT_ETC_LAYOUT_NEEDED`, emitted by `ExpandoTextCtrl` when resized.
+		"""
+		self._sendLayoutUpdatedEvent()
+
 
 class ContextualSettingsPanel(FillableSettingsPanel, metaclass=guiHelper.SIPABCMeta):
 	"""ABC for the different editor panels.
@@ -474,7 +501,7 @@ class TreeContextualPanel(ContextualSettingsPanel):
 
 	CATEGORY_PARAMS_CONTEXT_KEY = "TreeContextualPanel.categoryParams"
 
-	@dataclass
+	@dataclass(slots=True)
 	class CategoryParams:
 		tree: CustomTreeCtrl = None
 		treeNode: wx.TreeItemId = None
@@ -493,17 +520,24 @@ class TreeContextualPanel(ContextualSettingsPanel):
 		Deletes all the childs of a branch and recreates them. To use when items are add or deletes.
 		"""
 		self.Parent.Parent.refreshNodePanelData(parentNodeId)
-		if deleteChildren:
-			self.hardRefreshChildren(parentNodeId)
-		else:
-			self.softRefreshChildren(parentNodeId)
+		tree = self.categoryParams.tree
+		# Avoid repainting the tree upon each node deletion, insertion or relabelling
+		tree.Freeze()
+		try:
+			if deleteChildren:
+				self.hardRefreshChildren(parentNodeId)
+			else:
+				self.softRefreshChildren(parentNodeId)
+		finally:
+			tree.Thaw()
 
 	def hardRefreshChildren(self, parentNodeId):
 		prm = self.categoryParams
 		parentTreeNodeInfo = prm.tree.getTreeNodeInfo(parentNodeId)
 		prm.tree.DeleteChildren(parentNodeId)
-		if parentTreeNodeInfo.children:
-			prm.tree.addToListCtrl(parentTreeNodeInfo.children, parentNodeId)
+		children = parentTreeNodeInfo.children
+		if children:
+			prm.tree.addToListCtrl(children, parentNodeId)
 			prm.tree.Expand(parentNodeId)
 
 	def softRefreshChildren(self, parentNodeId):
@@ -595,6 +629,9 @@ class TreeMultiCategorySettingsDialog(ContextualMultiCategorySettingsDialog):
 	def initData(self, context: Mapping[str, Any]) -> None:
 		super().initData(context)
 		self.categoryClasses = self.initCatClasses()
+		self._categoryIndexes = {
+			nodeInfo.categoryClass: index for index, nodeInfo in enumerate(self.categoryClasses)
+		}
 		self.catListCtrl.addToListCtrl(self.categoryClasses)
 		self.catListCtrl.SelectItem(self.catListCtrl.GetFirstChild(self.root)[0])
 		self.catListCtrl.ExpandAll()
@@ -602,6 +639,11 @@ class TreeMultiCategorySettingsDialog(ContextualMultiCategorySettingsDialog):
 	def getFirstChild(self):
 		return self.categoryClasses[0]
 
+	def getCategoryIndex(self, categoryClass: type(TreeContextualPanel)) -> int:
+		"""Retrieve the index of the root category node for the given class.
+		"""
+		return self._categoryIndexes[categoryClass]
+
 	def initCatClasses(self):
 		categoryClasses = []
 		for categoryClass, childrenGetterName in self.categoryInitList:
@@ -616,7 +658,7 @@ class TreeMultiCategorySettingsDialog(ContextualMultiCategorySettingsDialog):
 			self.context[panel.CATEGORY_PARAMS_CONTEXT_KEY] = newCatInfos.categoryParams
 			panel.initData(self.context)
 			return panel
-		panel = newCatInfos.categoryClass(parent=self.container)
+		panel = newCatInfos.categoryClass(parent=self.container, **(newCatInfos.categoryKwargs or {}))
 		panel.Hide()
 		self.containerSizer.Add(
 			panel, flag=wx.ALL | wx.EXPAND, proportion=1,
@@ -663,12 +705,15 @@ class TreeMultiCategorySettingsDialog(ContextualMultiCategorySettingsDialog):
 	def cycleThroughCategories(self, previous=False):
 		tree = self.catListCtrl
 		selected = tree.GetSelection()
-		parent = tree.GetItemParent(selected)
-		children = tree.getChildren(parent)
-		index = children.index(selected)
-		index += -1 if previous else 1
-		index %= len(children)
-		child = children[index]
+		# Step to the adjacent sibling rather than listing all children to find the current index
+		if previous:
+			child = tree.GetPrevSibling(selected)
+			if not child.IsOk():  # Wrap around
+				child = tree.GetLastChild(tree.GetItemParent(selected))
+		else:
+			child = tree.GetNextSibling(selected)
+			if not child.IsOk():  # Wrap around
+				child, cookie = tree.GetFirstChild(tree.GetItemParent(selected))
 		treeHadFocus = tree.HasFocus()
 		tree.SelectItem(child)
 		catInfos = tree.getTreeNodeInfo(child)
@@ -742,13 +787,20 @@ class TreeMultiCategorySettingsDialog(ContextualMultiCategorySettingsDialog):
 		raise LookupError(f"{categoryClass}, {categoryParams}")
 
 
+def _getNoChildren():
+	return []
+
+
 class TreeNodeInfo:
 
-	def __init__(self, categoryClass, title=None, childrenGetter=None, categoryParams=None):
+	def __init__(self, categoryClass, title=None, childrenGetter=None, categoryParams=None, categoryKwargs=None):
 		self.categoryClass = categoryClass
+		# Additional keyword arguments passed to `categoryClass` upon instantiation
+		self.categoryKwargs = categoryKwargs
 		self.title = title
 		if not childrenGetter:
-			childrenGetter = lambda: []
+			# Shared rather than a new lambda for each leaf node
+			childrenGetter = _getNoChildren
 		self.childrenGetter = childrenGetter
 		if categoryParams is not None:
 			self.categoryParams = categoryParams
@@ -917,17 +969,11 @@ class SingleFieldEditorMixin(metaclass=guiHelper.SIPABCMeta):
 	def getFieldDisplayValue(cls, value: Any, choices: Mapping[Any, str] = None) -> str:
 		if choices is not None:
 			try:
-				index = tuple(choices.keys()).index(value)
-			except ValueError:
+				return choices[value]
+			except KeyError:
 				raise ValueError(f"Can't find index: {value!r} not in {choices!r}")
-			return tuple(choices.values())[index]
 		elif isinstance(value, bool):
-			if value:
-				# Translators: The display value of a yes/no field
-				return _("Yes")
-			else:
-				# Translators: The displayed value of a yes/no field
-				return _("No")
+			return _YES if value else _NO
 		return str(value)
 	
 	@property
@@ -972,10 +1018,32 @@ class SingleFieldEditorMixin(metaclass=guiHelper.SIPABCMeta):
 		self.setFieldValue(evt.IsChecked())
 		self.onEditor_change()
 	
+	def getEditorChoiceIndex(self, value: Any) -> int:
+		"""Retrieve the index of the given value in `editorChoices`.
+		
+		Raises `ValueError` if not found.
+		Sub-classes may override to use a precomputed index.
+		"""
+		return tuple(self.editorChoices.keys()).index(value)
+	
+	def getEditorChoiceLabels(self) -> Sequence[str]:
+		"""Retrieve the labels of `editorChoices`, in order.
+		
+		Sub-classes may override to use a precomputed sequence.
+		"""
+		return tuple(self.editorChoices.values())
+	
+	def getEditorChoiceValue(self, index: int) -> Any:
+		"""Retrieve the value at the given index in `editorChoices`.
+		
+		Sub-classes may override to use a precomputed index.
+		"""
+		return tuple(self.editorChoices.keys())[index]
+	
 	@guarded
 	def onEditor_choice(self, evt):
 		index = evt.Selection
-		self.setFieldValue(tuple(self.editorChoices.keys())[index])
+		self.setFieldValue(self.getEditorChoiceValue(index))
 		self.onEditor_change()
 	
 	@guarded
@@ -990,13 +1058,19 @@ class SingleFieldEditorMixin(metaclass=guiHelper.SIPABCMeta):
 			value = not value
 		elif editorType is EditorType.CHOICE:
 			choices = self.editorChoices
-			keys = tuple(choices.keys())
 			try:
-				index = (keys.index(value) + (-1 if previous else 1)) % len(choices)  # Wrap arround
+				index = self.getEditorChoiceIndex(value)
 			except ValueError:
 				notifyError(f"value: {value!r}, choices: {choices!r}")
 				return
-			value = keys[index]
+			# Wrap around
+			if previous:
+				index = (index or len(choices)) - 1
+			else:
+				index += 1
+				if index == len(choices):
+					index = 0
+			value = self.getEditorChoiceValue(index)
 		elif editorType is EditorType.TEXT:
 			self.editor.SetFocus()
 			return
@@ -1022,15 +1096,13 @@ class SingleFieldEditorMixin(metaclass=guiHelper.SIPABCMeta):
 			editor.Value = value
 		elif editorType is EditorType.CHOICE:
 			# Does not emit wx.EVT_CHOICE
-			editor.Selection = tuple(self.editorChoices.keys()).index(value)
+			editor.Selection = self.getEditorChoiceIndex(value)
 		elif editorType is EditorType.TEXT:
 			# Does not emit wx.EVT_TEXT
 			editor.ChangeValue(value if value is not None else "")
 	
 	def updateEditorChoices(self):
-		editor = self.editor
-		editor.Clear()
-		editor.AppendItems(tuple(self.editorChoices.values()))
+		self.editor.Set(self.getEditorChoiceLabels())
 	
 	def updateEditorLabel(self):
 		# Translators: A field label. French typically adds a space before the colon.
@@ -1052,7 +1124,7 @@ class SingleFieldEditorPanelBase(SingleFieldEditorMixin, TreeContextualPanel):
 	editorLabel: wx.Control = None
 	editorType: EditorType = None
 	
-	@dataclass
+	@dataclass(slots=True)
 	class CategoryParams(TreeContextualPanel.CategoryParams):
 		editorChoices: Mapping[Any, str] = None
 		fieldDisplayName: str = None
@@ -50,6 +50,10 @@ else:
 addonHandler.initTranslation()
 
 
+# The expected change in the number of gestures, see `ActionsPanelBase.onGestureChange`
+_GESTURES_COUNT_DELTA = {Change.CREATION: 1, Change.UPDATE: 0, Change.DELETION: -1}
+
+
 class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 	"""ABC for Actions panels
 	
@@ -69,6 +73,19 @@ class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 	
 	def __init__(self, *args, **kwargs):
 		self.hideable: Mapping[str, Sequence[wx.Window]] = {}
+		# Whether the items shown are those for a rule type supporting actions
+		self._shownSupported: bool = None
+		# The items to show, indexed by whether actions are supported
+		self._hideableBySupported: tuple[Sequence[wx.Window], Sequence[wx.Window]] = ((), ())
+		# The gesture identifiers listed in `gesturesListBox`, in order
+		self._gesturesListBoxIds: Sequence[str] = ()
+		# Keyed by (gesture identifier, action), see `getGestureLabel`
+		self._gestureLabels: Mapping[tuple[str, str], str] = {}
+		# The actions of the web module, see `getGestureLabel`
+		self._actions: Mapping[str, str] = None
+		# The actions listed in `autoActionChoice`, in order, and their index
+		self._autoActionChoiceValues: Sequence[str] = ()
+		self._autoActionChoiceIndexes: Mapping[str, int] = {}
 		super().__init__(*args, **kwargs)
 	
 	def makeSettings(self, settingsSizer):
@@ -156,11 +173,20 @@ class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 		gbSizer.Add(item, pos=(row, col), span=(1, 3), flag=wx.EXPAND)
 		
 		gbSizer.AddGrowableCol(2)
+		
+		# Spacers are kept along with the controls: Hiding them collapses their gaps
+		self._hideableBySupported = (
+			tuple(self.hideable["IfNotSupported"]),
+			tuple(self.hideable["IfSupported"]),
+		)
 	
 	def initData(self, context: Mapping[str, Any]) -> None:
 		super().initData(context)
 		data = self.getData()
 		self.gesturesMap = data.setdefault("gestures", {})
+		# The available actions might have changed
+		self._actions = None
+		self._gestureLabels.clear()
 		self.updateGesturesListBox()
 		self.updateAutoActionChoice(refreshChoices=True)
 	
@@ -183,11 +209,11 @@ class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 		
 	def getSelectedGesture(self):
 		index = self.gesturesListBox.Selection
-		return self.gesturesListBox.GetClientData(index) if index > -1 else None
+		return self._gesturesListBoxIds[index] if index > -1 else None
 	
 	@guarded
 	def onAutoActionChoice(self, evt):
-		action = evt.EventObject.GetClientData(evt.Selection)
+		action = self._autoActionChoiceValues[evt.Selection]
 		self.getData().setdefault("properties", {})["autoAction"] = action
 	
 	@guarded
@@ -202,7 +228,7 @@ class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 	@guarded
 	def onDeleteGesture(self, evt):
 		index = self.gesturesListBox.Selection
-		id = self.gesturesListBox.GetClientData(index)
+		id = self._gesturesListBoxIds[index]
 		del self.gesturesMap[id]
 		self.onGestureChange(Change.DELETION, index)
 
@@ -219,66 +245,119 @@ class ActionsPanelBase(RuleAwarePanelBase, metaclass=guiHelper.SIPABCMeta):
 		del context["data"]["gestures"]
 	
 	def onGestureChange(self, change: Change, id: str):
-		if change is Change.DELETION:
-			index = None
-		self.updateGesturesListBox(selectId=id, focus=True)
+		"""Update the gestures list box after a single change.
+		
+		`id` is the gesture identifier, or the former index of the gesture upon deletion.
+		"""
+		map = self.gesturesMap
+		if len(map) - len(self._gesturesListBoxIds) != _GESTURES_COUNT_DELTA[change]:
+			# Binding an already bound identifier overwrote an existing entry
+			self.updateGesturesListBox(selectId=id, focus=True)
+			return
+		ids = tuple(map)
+		listBox = self.gesturesListBox
+		listBox.Freeze()
+		try:
+			if change is Change.DELETION:
+				listBox.Delete(id)
+				index = min(id, len(ids) - 1)
+			else:
+				index = ids.index(id)
+				label = self.getGestureLabel(id, map[id])
+				if change is Change.UPDATE:
+					# The edited gesture is the selected one, but its identifier might have changed
+					oldIndex = listBox.Selection
+					if oldIndex == index:
+						listBox.SetString(index, label)
+					else:
+						listBox.Delete(oldIndex)
+						listBox.Insert(label, index)
+				else:
+					listBox.Insert(label, index)
+			self._gesturesListBoxIds = ids
+			if index > -1:
+				listBox.SetSelection(index)
+		finally:
+			listBox.Thaw()
+		self.updateGestureButtons()
+		listBox.SetFocus()
 	
 	def updateAutoActionChoice(self, refreshChoices: bool):
 		ctrl = self.autoActionChoice
 		value = self.getAutoAction()
 		if refreshChoices:
 			choices = self.getAutoActionChoices()
-			ctrl.Clear()
-			for action, displayName in choices.items():
-				ctrl.Append(displayName, action)
-			index = tuple(choices.keys()).index(self.getAutoAction())
-		else:
-			index = tuple(ctrl.GetClientData(i) for i in range(ctrl.Count)).index(value)
-		ctrl.SetSelection(index)
+			ctrl.Set(list(choices.values()))
+			self._autoActionChoiceValues = tuple(choices)
+			self._autoActionChoiceIndexes = {action: index for index, action in enumerate(choices)}
+		ctrl.SetSelection(self._autoActionChoiceIndexes[value])
+	
+	def getGestureLabel(self, gestureIdentifier: str, action: str) -> str:
+		key = (gestureIdentifier, action)
+		label = self._gestureLabels.get(key)
+		if label is None:
+			actions = self._actions
+			if actions is None:
+				# Retrieved only if needed: `RuleManager.getActions` scans the web module's attributes
+				actions = self._actions = self.getRuleManager().getActions()
+			source, main = inputCore.getDisplayTextForGestureIdentifier(gestureIdentifier)
+			# The fallback is only built for an action missing from the web module
+			actionDName = actions[action] if action in actions else f"*{action}"
+			# Translators: A gesture binding on the editor dialogs
+			label = self._gestureLabels[key] = "{gesture}: {action}".format(gesture=main, action=actionDName)
+		return label
+	
+	def updateGestureButtons(self):
+		enableBtn = self.gesturesListBox.Selection > -1
+		for btn in (self.deleteButton, self.editButton):
+			btn.Enable(enableBtn)
 	
 	def updateGesturesListBox(self, selectId: str = None, focus: bool = False):
-		mgr = self.getRuleManager()
 		map = self.gesturesMap
 		if selectId is None:
 			selectId = self.getSelectedGesture()
 		listBox = self.gesturesListBox
-		listBox.Clear()
-		selectIndex = 0
-		for index, (gestureIdentifier, action) in enumerate(map.items()):
-			source, main = inputCore.getDisplayTextForGestureIdentifier(gestureIdentifier)
-			actionDName = mgr.getActions().get(action, f"*{action}")
-			listBox.Append(
-				# Translators: A gesture binding on the editor dialogs
-				"{gesture}: {action}".format(gesture=main, action=actionDName),
-				gestureIdentifier
-			)
-			if gestureIdentifier == selectId:
-				selectIndex = index
-		if self.gesturesMap:
-			listBox.SetSelection(selectIndex)
-		enableBtn = listBox.Selection > -1
-		for btn in (self.deleteButton, self.editButton):
-			btn.Enable(enableBtn)
+		labels = [
+			self.getGestureLabel(gestureIdentifier, action)
+			for gestureIdentifier, action in map.items()
+		]
+		ids = tuple(map)
+		# Native list boxes insert and repaint item by item
+		listBox.Freeze()
+		try:
+			listBox.Set(labels)
+			if map:
+				listBox.SetSelection(ids.index(selectId) if selectId in map else 0)
+		finally:
+			listBox.Thaw()
+		self._gesturesListBoxIds = ids
+		self.updateGestureButtons()
 		if focus:
 			self.gesturesListBox.SetFocus()
 	
 	@guarded
 	def onPanelActivated(self):
 		super().onPanelActivated()
-		supported = self.getRuleType() in (ruleTypes.ZONE, ruleTypes.MARKER)
+		supported = self.getRuleType() in ruleTypes.ACTION_TYPES
 		self.panelDescription = "" if supported else self.descriptionIfNoneSupported
+		if supported is self._shownSupported:
+			return
 		self.Freeze()
-		for item in self.hideable["IfSupported"]:
-			item.Show(supported)
-		for item in self.hideable["IfNotSupported"]:
-			item.Show(not supported)
-		self.Thaw()
+		try:
+			# Hide first so that both sets are never shown together
+			for item in self._hideableBySupported[not supported]:
+				item.Show(False)
+			for item in self._hideableBySupported[supported]:
+				item.Show(True)
+		finally:
+			self.Thaw()
+		self._shownSupported = supported
 		self._sendLayoutUpdatedEvent()
 	
 	def onSave(self):
 		super().onSave()
 		data = self.getData()
-		if self.getRuleType() not in (ruleTypes.ZONE, ruleTypes.MARKER):
+		if self.getRuleType() not in ruleTypes.ACTION_TYPES:
 			data.pop("gestures", None)
 			data.get("properties", {}).pop("autoAction", None)
 		elif not data.get("gestures"):
@@ -53,6 +53,7 @@ from . import (
 	ValidationError,
 	stripAccel,
 	stripAccelAndColon,
+	updateTextValue,
 )
 from .actions import ActionsPanelBase
 from .rule.abc import RuleAwarePanelBase
@@ -60,9 +61,9 @@ from .properties import Properties, PropertiesPanelBase, Property
 
 
 if sys.version_info[1] < 9:
-    from typing import Mapping, Sequence
+    from typing import Iterator, Mapping, Sequence
 else:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
 
 addonHandler.initTranslation()
@@ -153,9 +154,8 @@ def translateStatesLblToId(expr, raiseOnError=True):
 	return translateExprValues(expr, translate)
 
 
-def getSummary_context(data) -> Sequence[str]:
-	parts = []
-	for key, label in list(CriteriaPanel.FIELDS.items()):
+def _iterSummary_context(data) -> Iterator[str]:
+	for key, label in CriteriaPanel.FIELDS.items():
 		if (
 			key not in CriteriaPanel.CONTEXT_FIELDS
 			or (
@@ -165,13 +165,27 @@ def getSummary_context(data) -> Sequence[str]:
 		):
 			continue
 		value = data[key]
-		parts.append("{} {}".format(stripAccel(label), value))
+		yield "{} {}".format(stripAccel(label), value)
+
+
+def _getSummary_contextIfGlobal() -> str:
+	# Translators: A mention on the Criteria summary report
+	return _("Global - Applies to the whole web module")
+
+
+def getSummary_context(data) -> Sequence[str]:
+	parts = list(_iterSummary_context(data))
 	if not parts:
-		# Translators: A mention on the Criteria summary report
-		parts.append(_("Global - Applies to the whole web module"))
+		parts.append(_getSummary_contextIfGlobal())
 	return parts
 
 
+def getSummary_contextFirst(data) -> str:
+	"""Retrieve the first item of `getSummary_context`, without computing the others.
+	"""
+	return next(_iterSummary_context(data), None) or _getSummary_contextIfGlobal()
+
+
 def getSummary(context, data, indent="", condensed=False) -> str:
 	parts = []
 	subParts = getSummary_context(data)
@@ -180,7 +194,7 @@ def getSummary(context, data, indent="", condensed=False) -> str:
 	else:
 		parts.extend(subParts)
 	subParts = []
-	for key, label in list(CriteriaPanel.FIELDS.items()):
+	for key, label in CriteriaPanel.FIELDS.items():
 		if key in CriteriaPanel.CONTEXT_FIELDS or key not in data:
 			continue
 		value = data[key]
@@ -201,16 +215,18 @@ def getSummary(context, data, indent="", condensed=False) -> str:
 	
 	# Properties
 	subParts = []
-	props = Properties(context, data.get("properties", {}), iterOnlyFirstMap=True)
-	for prop in props:
-		subParts.append(
-			# Translators: A mention on the Criteria Summary report
-			_("{indent}{field}: {value}").format(
-				indent="  " if not condensed else "",
-				field=prop.displayName,
-				value=prop.displayValue,
+	propsData = data.get("properties")
+	# Only the properties overridden by the criteria are listed: No need for a container if there is none
+	if propsData:
+		for prop in Properties(context, propsData, iterOnlyFirstMap=True):
+			subParts.append(
+				# Translators: A mention on the Criteria Summary report
+				_("{indent}{field}: {value}").format(
+					indent="  " if not condensed else "",
+					field=prop.displayName,
+					value=prop.displayValue,
+				)
 			)
-		)
 	if subParts:
 		# Translators: The label for a section on the Criteria Summary report
 		parts.append(_("{section}:").format(section=PropertiesPanel.title))
@@ -227,7 +243,10 @@ def getSummary(context, data, indent="", condensed=False) -> str:
 
 @guarded
 def testCriteria(context):
-	ruleData = deepcopy(context["data"]["rule"])
+	# The alternatives are replaced below: No need to deep-copy them
+	ruleData = deepcopy({
+		key: value for key, value in context["data"]["rule"].items() if key != "criteria"
+	})
 	ruleData["name"] = "__tmp__"
 	ruleData.pop("new", None)
 	ruleData["type"] = ruleTypes.MARKER
@@ -236,7 +255,10 @@ def testCriteria(context):
 	critData.pop("criteriaIndex", None)
 	ruleData["criteria"] = [critData]
 	ruleData.setdefault("properties", {})['multiple'] = True
-	critData.setdefault("properties", {}).pop("multiple", True)
+	# Copied as well, not to alter the edited criteria
+	critData["properties"] = {
+		key: value for key, value in critData.get("properties", {}).items() if key != "multiple"
+	}
 	mgr = context["webModule"].ruleManager
 	from ..ruleHandler import Rule
 	rule = Rule(mgr, ruleData)
@@ -245,9 +267,9 @@ def testCriteria(context):
 	results = rule.getResults()
 	duration = time.time() - start
 	if len(results) == 1:
-		message = _("Found 1 result in {:.3f} seconds.".format(duration))
+		message = _("Found 1 result in {:.3f} seconds.").format(duration)
 	elif results:
-		message = _("Found {} results in {:.3f} seconds.".format(len(results), duration))
+		message = _("Found {} results in {:.3f} seconds.").format(len(results), duration)
 	else:
 		message = _("No result found on the current page.")
 	gui.messageBox(message, caption=_("Criteria test"))
@@ -305,7 +327,7 @@ class GeneralPanel(CriteriaEditorPanel):
 		gbSizer.Add(item, pos=(row, 0))
 		gbSizer.Add(scale(guiHelper.SPACE_BETWEEN_ASSOCIATED_CONTROL_HORIZONTAL, 0), pos=(row, 1))
 		item = self.summaryText = ExpandoTextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
-		item.Bind(EVT_ETC_LAYOUT_NEEDED, lambda evt: self._sendLayoutUpdatedEvent())
+		item.Bind(EVT_ETC_LAYOUT_NEEDED, self.onLayoutNeeded)
 		gbSizer.Add(item, pos=(row, 2), span=(2, 1), flag=wx.EXPAND)
 
 		row += 2
@@ -326,14 +348,13 @@ class GeneralPanel(CriteriaEditorPanel):
 		super().initData(context)
 		data = self.getData()
 		new = data.get("new", False)
-		self.sequenceOrderChoice.Clear()
 		nbCriteria = len(context["data"]["rule"]["criteria"]) + (1 if new else 0)
 		if nbCriteria == 1:
+			self.sequenceOrderChoice.Clear()
 			for item in self.hideable:
 				item.Show(False)
 		else:
-			for index in range(nbCriteria):
-				self.sequenceOrderChoice.Append(str(index + 1))
+			self.sequenceOrderChoice.Set([str(index + 1) for index in range(nbCriteria)])
 			index = data.get("criteriaIndex", nbCriteria + 1)
 			self.sequenceOrderChoice.SetSelection(index)
 		self.criteriaName.Value = data.get("name", "")
@@ -352,7 +373,7 @@ class GeneralPanel(CriteriaEditorPanel):
 		return getSummary(self.context, self.getData())
 
 	def refreshSummary(self):
-		self.summaryText.Value = self.getSummary()
+		updateTextValue(self.summaryText, self.getSummary())
 
 	def onPanelActivated(self):
 		self.refreshSummary()
@@ -928,9 +949,8 @@ class PropertiesPanel(PropertiesPanelBase, CriteriaEditorPanel):
 			iterOnlyFirstMap=True,
 		)
 	
-	def listCtrl_insert(self, index: int, prop: Property) -> None:
-		super().listCtrl_insert(index, prop)
-		self.listCtrl.SetStringItem(index, 2, prop.displayDefault)
+	def listCtrl_getRow(self, prop: Property) -> tuple[str, ...]:
+		return super().listCtrl_getRow(prop) + (prop.displayDefault,)
 
 	def listCtrl_update_all(self):
 		super().listCtrl_update_all()
@@ -941,10 +961,11 @@ class PropertiesPanel(PropertiesPanelBase, CriteriaEditorPanel):
 	@guarded
 	def onAddPropBtn(self, evt):
 		props = self.props
+		overridden = props._map.maps[0]
 		overrideable = tuple(
 			props.getProperty(name)
 			for name in props.getSupportedPropertiesName()
-			if name not in props._map.maps[0]
+			if name not in overridden
 		)
 		startId = wx.Window.NewControlId(len(overrideable))
 		try:
@@ -961,7 +982,7 @@ class PropertiesPanel(PropertiesPanelBase, CriteriaEditorPanel):
 				pass
 			notifyError()
 			return
-		prop = menuIdProp[menuId] if menuId != wx.ID_NONE else None
+		prop = menuIdProp.get(menuId)
 		if not prop:
 			return
 		prop.value = prop.default  # Setting any value actually adds to the ChainMap based container
@@ -169,13 +169,14 @@ class GestureBindingDialog(wx.Dialog, ScalingMixin):
 		oldId = data.pop("oldId")
 		newId = data["gestureIdentifier"] = data.pop("newId")
 		action = data["action"]
-		tmp = gestures.copy()
 		if oldId:
-			del tmp[oldId]
-		tmp[newId] = action
+			del gestures[oldId]
+		gestures[newId] = action
+		# Re-insert in place so that the shared mapping stays ordered by identifier
+		items = sorted(gestures.items())
 		gestures.clear()
-		gestures.update({k : tmp[k] for k in sorted(tmp)})
-		data["index"] = tuple(gestures.keys()).index(newId)
+		gestures.update(items)
+		data["index"] = next(index for index, (id, action) in enumerate(items) if id == newId)
 		self.EndModal(wx.ID_OK)
 	
 	@guarded
@@ -52,7 +52,7 @@ class Menu(wx.Menu):
 		self.context = context
 		
 		if webAccess.webAccessEnabled:
-			webModule = context["webModule"] if "webModule" in context else None
+			webModule = context.get("webModule")
 			
 			if webModule is not None:
 				item = self.Append(
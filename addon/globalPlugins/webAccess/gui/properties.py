@@ -21,9 +21,9 @@
 
 __author__ = "Sendhil Randon <sendhil.randon-ext@francetravail.fr>"
 
-from collections import ChainMap
 from abc import abstractmethod
 from enum import Enum
+from functools import cached_property
 import sys
 from typing import Any
 import wx
@@ -31,73 +31,98 @@ import wx
 import addonHandler
 import gui
 from gui import guiHelper
+from logHandler import log
 import speech
 import ui
 
 from ..ruleHandler.controlMutation import MUTATIONS_BY_RULE_TYPE, mutationLabels
-from ..ruleHandler.properties import PropertiesBase, PropertySpec, PropertySpecValue, PropertyValue
+from ..ruleHandler.properties import (
+	PROPERTY_NAMES,
+	PropertiesBase,
+	PropertySpec,
+	PropertySpecValue,
+	PropertyValue,
+)
 from ..utils import guarded, logException
-from . import ContextualSettingsPanel, EditorType, ListCtrlAutoWidth, SingleFieldEditorMixin
+from . import _NO, _YES, ContextualSettingsPanel, EditorType, ListCtrlAutoWidth, SingleFieldEditorMixin
 
 
 if sys.version_info[1] < 9:
-    from typing import Iterator, Mapping
+    from typing import Iterator, Mapping, Sequence, Set
 else:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator, Mapping, Sequence, Set
 
 
 addonHandler.initTranslation()
 
 
+_UNRESOLVED = object()
+"""Sentinel for a lazily computed value not yet resolved.
+"""
+
+
 class Property:
 	
-	__slots__ = ("_container", "name")
+	# `__dict__` is required by `functools.cached_property`
+	__slots__ = ("_container", "name", "_spec", "_getDisplayValue", "__dict__")
 	
 	def __init__(self, container: "Properties", name: str):
 		self._container: "Properties" = container
 		self.name = name
+		# Resolved once rather than through `PropertySpec.__getitem__` and `__getattr__` on each access
+		self._spec: PropertySpecValue = PropertySpec[name].value
+		# Specialized for the editor type upon first call to `getDisplayValue`
+		self._getDisplayValue = None
 	
 	def __getattr__(self, name):
 		if name in PropertySpecValue.__slots__:
-			return getattr(PropertySpec[self.name], name)
+			return getattr(self._spec, name)
 		return super().__getattribute__(name)
 	
-	@property
+	@cached_property
 	@logException
 	def choices(self) -> Mapping[str, str]:
 		if self.editorType is not EditorType.CHOICE:
 			return None
-		container = self._container
-		context = container._context
-		cache = context.setdefault("propertyChoiceCache", {})
+		context = self._container._context
 		name = self.name
-		if name in cache:
-			return cache[name]
-		undefined = {
+		# Inserted as first item
+		choices = {
 			None: self.displayValueIfUndefined
 		} if self.displayValueIfUndefined is not None else {}
 		# The `match` statement was added only in Python 3.10
-		# Mapping union was added only in Python 3.9
 		if name == "autoAction":
-			choices = dict(ChainMap(
-				context["webModule"].ruleManager.getActions(),
-				undefined  # Inserted as first item
-			))
+			choices.update(context["webModule"].ruleManager.getActions())
 		elif name == "mutation":
-			choices = dict(ChainMap(
-				{
-					value: mutationLabels[value]
-					for ruleType, values in MUTATIONS_BY_RULE_TYPE.items()
-					for value in values
-					if ruleType in self.ruleTypes
-				},
-				undefined  # Inserted as first item
-			))
+			ruleTypes = self.ruleTypes
+			choices.update(
+				(value, mutationLabels[value])
+				for ruleType, values in MUTATIONS_BY_RULE_TYPE.items()
+				if ruleType in ruleTypes
+				for value in values
+			)
 		else:
 			raise ValueError(f"prop.name: {name!r}")
-		cache[name] = choices
 		return choices
 	
+	@cached_property
+	def choiceIndexes(self) -> Mapping[PropertyValue, int]:
+		"""The index of each key in `choices`
+		"""
+		return {value: index for index, value in enumerate(self.choices)}
+	
+	@cached_property
+	def choiceLabels(self) -> Sequence[str]:
+		"""The labels of `choices`, in order
+		"""
+		return tuple(self.choices.values())
+	
+	@cached_property
+	def choiceValues(self) -> Sequence[PropertyValue]:
+		"""The keys of `choices`, in order
+		"""
+		return tuple(self.choices)
+	
 	@property
 	@logException
 	def default(self) -> PropertyValue:
@@ -111,54 +136,81 @@ class Property:
 	@property
 	@logException
 	def displayName(self) -> str:
-		return PropertySpec[self.name].getDisplayName(self._container.ruleType)
+		container = self._container
+		key = (self.name, container.ruleType)
+		cache = container._displayNameCache
+		displayName = cache.get(key)
+		if displayName is None:
+			displayName = cache[key] = self._spec.getDisplayName(key[1])
+		return displayName
 	
 	@property
-	@logException
 	def displayValue(self) -> str:
-		return self.getDisplayValue(self.value)
+		# Hot path: Inlined `logException`
+		try:
+			return self.getDisplayValue(self.value)
+		except Exception:
+			log.exception(stack_info=True)
+			raise
 	
 	@property
 	@logException
 	def displayValueIfUndefined(self) -> str:
-		return PropertySpec[self.name].displayValueIfUndefined
+		return self._spec.displayValueIfUndefined
 	
-	@property
-	@logException
+	@cached_property
 	def editorType(self) -> EditorType:
-		if self.isRestrictedChoice:
-			return EditorType.CHOICE
-		elif issubclass(self.valueType, bool):
-			return EditorType.CHECKBOX
-		elif issubclass(self.valueType, str):
-			return EditorType.TEXT
-		else:
-			raise Exception(f"Unable to determine EditorType for property {self.name!r}")
+		"""Determined once from the spec, rather than through `issubclass` checks on each access
+		"""
+		# Hot path: Inlined `logException`
+		try:
+			if self.isRestrictedChoice:
+				return EditorType.CHOICE
+			elif issubclass(self.valueType, bool):
+				return EditorType.CHECKBOX
+			elif issubclass(self.valueType, str):
+				return EditorType.TEXT
+			else:
+				raise Exception(f"Unable to determine EditorType for property {self.name!r}")
+		except Exception:
+			log.exception(stack_info=True)
+			raise
 	
 	@property
-	@logException
 	def value(self) -> PropertyValue:
-		return getattr(self._container, self.name)
+		# Hot path: Inlined `logException`
+		try:
+			return getattr(self._container, self.name)
+		except Exception:
+			log.exception(stack_info=True)
+			raise
 	
 	@value.setter
 	def value(self, value: PropertyValue) -> None:
 		setattr(self._container, self.name, value)
 	
 	def getDisplayValue(self, value):
+		getDisplayValue = self._getDisplayValue
+		if getDisplayValue is None:
+			getDisplayValue = self._getDisplayValue = {
+				EditorType.CHECKBOX: Property._getDisplayValue_checkBox,
+				EditorType.CHOICE: Property._getDisplayValue_choice,
+				EditorType.TEXT: Property._getDisplayValue_text,
+			}[self.editorType]
+		return getDisplayValue(self, value)
+	
+	def _getDisplayValue_checkBox(self, value):
 		if value in (None, ""):
 			return self.displayValueIfUndefined
-		if self.isRestrictedChoice:
-			return self.choices[value]
-		if self.valueType is bool:
-			if value:
-				# Translators: The displayed value of a yes/no rule property
-				return _("Yes")
-			else:
-				# Translators: The displayed value of a yes/no rule property
-				return _("No")
-		if self.valueType is str:
-			return value
-		raise NotImplementedError(f"displayValue for {self.name}={value!r}")
+		return _YES if value else _NO
+	
+	def _getDisplayValue_choice(self, value):
+		if value in (None, ""):
+			return self.displayValueIfUndefined
+		return self.choices[value]
+	
+	def _getDisplayValue_text(self, value):
+		return value or self.displayValueIfUndefined
 	
 	def reset(self) -> None:
 		delattr(self._container, self.name)
@@ -174,29 +226,69 @@ class Properties(PropertiesBase):
 		super().__init__(*maps)
 		self._context = context
 		self._iterOnlyFirstMap = iterOnlyFirstMap
+		# Keyed by (property name, rule type)
+		self._displayNameCache: Mapping[tuple[str, str], str] = {}
+		# Resolved from the context upon first access, see `invalidate`
+		self._ruleType: str = _UNRESOLVED
+		# (ruleType, names in definition order, names set), see `_getSupported`
+		self._supportedCache: tuple[str, Sequence[str], Set[str]] = None
+		# Names of the properties to iterate over, see `_getIterNames`
+		self._iterNames: Sequence[str] = None
+		# (iterated names, index by name), see `getIndex`
+		self._indexCache: tuple[Sequence[str], Mapping[str, int]] = None
+		# Keyed by name, see `getProperty`
+		self._properties: Mapping[str, Property] = {}
+		# Whether a property was set or reset since the last `SinglePropertyEditorPanelBase.updateData`
+		self._changed = True
+		# The rule type the properties were last dumped for, see `SinglePropertyEditorPanelBase.updateData`
+		self._dumpedRuleType: str = _UNRESOLVED
+	
+	def __delattr__(self, name):
+		super().__delattr__(name)
+		self._iterNames = None
+		self._changed = True
+	
+	def __setattr__(self, name, value):
+		super().__setattr__(name, value)
+		if name in PROPERTY_NAMES:
+			self._iterNames = None
+			self._changed = True
 	
 	def __getitem__(self, item: int|str) -> Property:
 		if isinstance(item, int):
-			return tuple(iter(self))[item]
+			return self.getProperty(self._getIterNames()[item])
 		elif isinstance(item, str):
 			return self.getProperty(item)
 		else:
 			raise ValueError(f"item: {item!r}")
 	
 	def __iter__(self) -> Iterator[Property]:
-		yield from (
-			self.getProperty(name)
-			for name in self.getSupportedPropertiesName()
-			if not self._iterOnlyFirstMap or name in self._map.maps[0].keys()
-		)
+		yield from (self.getProperty(name) for name in self._getIterNames())
 	
 	@logException
 	def __len__(self):
-		return len(self._map.maps[0] if self._iterOnlyFirstMap else self.getSupportedPropertiesName())
+		return len(self._getIterNames())
+	
+	def _getIterNames(self) -> Sequence[str]:
+		if not self._iterOnlyFirstMap:
+			return self.getSupportedPropertiesName()
+		names = self._iterNames
+		if names is None:
+			first = self._map.maps[0]
+			names = self._iterNames = tuple(
+				name for name in self.getSupportedPropertiesName() if name in first
+			)
+		return names
 	
 	@property
 	@logException
 	def ruleType(self) -> str:
+		ruleType = self._ruleType
+		if ruleType is _UNRESOLVED:
+			ruleType = self._ruleType = self._resolveRuleType()
+		return ruleType
+	
+	def _resolveRuleType(self) -> str:
 		try:
 			return self._context["data"].get("rule", {}).get("type", None)
 		except KeyError as e1:
@@ -206,10 +298,51 @@ class Properties(PropertiesBase):
 			except Exception as e2:
 				raise NotImplementedError
 	
+	def invalidate(self) -> None:
+		"""Forget the cached rule type and iterated names, in case the context
+		or the underlying maps were changed externally.
+		
+		A changed rule type marks the container as changed, as the supported properties differ.
+		"""
+		ruleType = self._ruleType
+		if ruleType is not _UNRESOLVED and ruleType != self._resolveRuleType():
+			self._changed = True
+		self._ruleType = _UNRESOLVED
+		self._iterNames = None
+	
+	def _getSupported(self) -> tuple[str, Sequence[str], Set[str]]:
+		ruleType = self.ruleType
+		cache = self._supportedCache
+		if cache is None or cache[0] != ruleType:
+			names = super().getSupportedPropertiesName()
+			cache = self._supportedCache = (ruleType, names, frozenset(names))
+		return cache
+	
+	def getSupportedPropertiesName(self) -> Sequence[str]:
+		return self._getSupported()[1]
+	
+	def getIndex(self, name: str) -> int:
+		"""Retrieve the position of the given property when iterating over this container.
+		
+		Raises `ValueError` if not found.
+		"""
+		names = self._getIterNames()
+		cache = self._indexCache
+		if cache is None or cache[0] is not names:
+			cache = self._indexCache = (names, {name: index for index, name in enumerate(names)})
+		try:
+			return cache[1][name]
+		except KeyError:
+			raise ValueError(f"Property not iterated over: {name}")
+	
 	def getProperty(self, name: str) -> Property:
-		if name not in self.getSupportedPropertiesName():
+		if name not in self._getSupported()[2]:
 			raise ValueError(f"Property not supported for rule type {self.ruleType}: {name}")
-		return Property(self, name)
+		# Keep returning the same instance so that its cached values are reused
+		prop = self._properties.get(name)
+		if prop is None:
+			prop = self._properties[name] = Property(self, name)
+		return prop
 
 
 class SinglePropertyEditorPanelBase(SingleFieldEditorMixin, ContextualSettingsPanel):
@@ -257,10 +390,35 @@ class SinglePropertyEditorPanelBase(SingleFieldEditorMixin, ContextualSettingsPa
 		"""
 	
 	def updateData(self):
+		props = self.props
+		# Called for every panel upon each summary refresh: Skip the rewrite if neither
+		# the properties nor the rule type changed since the previous one.
+		# The cached rule type cannot tell, as it might have been refreshed in the meantime.
+		ruleType = props._resolveRuleType()
+		if not props._changed and ruleType == props._dumpedRuleType:
+			return
+		# Dump only the properties supported by the current rule type
+		props.invalidate()
 		data = self.getData()
-		dumped = self.props.dump()
+		dumped = props.dump()
 		data.clear()
 		data.update(dumped)
+		# The iterated names might have changed along with the data
+		props.invalidate()
+		props._changed = False
+		props._dumpedRuleType = ruleType
+	
+	def getEditorChoiceIndex(self, value):
+		try:
+			return self.prop.choiceIndexes[value]
+		except KeyError:
+			raise ValueError(f"{value!r} not in {self.editorChoices!r}")
+	
+	def getEditorChoiceLabels(self):
+		return self.prop.choiceLabels
+	
+	def getEditorChoiceValue(self, index):
+		return self.prop.choiceValues[index]
 	
 	def getFieldValue(self):
 		return self.prop.value
@@ -300,24 +458,26 @@ class PropertiesPanelBase(SinglePropertyEditorPanelBase, metaclass=guiHelper.SIP
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 		self._prop: Property = None
+		# The editor type whose controls are currently shown, if any
+		self._shownEditorType: EditorType = None
+		# The cells text for each row currently in the list, see `listCtrl_getRow`
+		self._listCtrl_rows: list[tuple[str, ...]] = []
+		# Updated upon selection, -1 if unknown
+		self._listCtrl_selectedIndex: int = -1
 	
 	@property
-	@logException
 	def editor(self) -> wx.Control:
-		return {
-			EditorType.CHECKBOX: self.editor_checkBox,
-			EditorType.CHOICE: self.editor_choice_ctrl,
-			EditorType.TEXT: self.editor_text_ctrl,
-		}[self.prop.editorType]
+		# Hot path: Inlined `logException`
+		try:
+			return self._editorByEditorType[self.prop.editorType]
+		except Exception:
+			log.exception(stack_info=True)
+			raise
 	
 	@property
 	@logException
 	def editorLabel(self) -> wx.Control:
-		return {
-			EditorType.CHECKBOX: self.editor_checkBox,
-			EditorType.CHOICE: self.editor_choice_label,
-			EditorType.TEXT: self.editor_text_label,
-		}[self.prop.editorType]
+		return self._editorLabelByEditorType[self.prop.editorType]
 	
 	@property
 	@logException
@@ -327,21 +487,20 @@ class PropertiesPanelBase(SinglePropertyEditorPanelBase, metaclass=guiHelper.SIP
 	@prop.setter
 	def prop(self, prop: Property) -> None:
 		self._prop = prop
-		editorLabel = self.editorLabel
-		editor = self.editor
 		if prop.editorType is EditorType.CHOICE:
 			self.updateEditorChoices()
 		self.updateEditor()
 		self.updateEditorLabel()
-		self.Freeze()
-		hideable = self.hideable
-		hideIfNot = lambda editorType: f"hideIfNot{editorType.name}"
-		show = {hideIfNot(editorType): False for editorType in EditorType}
-		show[hideIfNot(prop.editorType)] = True
-		for key, showItems in show.items():
-			for uiItem in hideable[key]:
-				uiItem.Show(showItems)
-		self.Thaw()
+		if prop.editorType is not self._shownEditorType:
+			self.Freeze()
+			active = self._editorTypeIndex[prop.editorType]
+			for index, uiItems in enumerate(self._hideableByEditorType):
+				show = index == active
+				for uiItem in uiItems:
+					uiItem.Show(show)
+			self.Thaw()
+			self._shownEditorType = prop.editorType
+		# Still needed as the label width might have changed
 		self._sendLayoutUpdatedEvent()
 	
 	def makeSettings(self, settingsSizer):
@@ -426,6 +585,21 @@ class PropertiesPanelBase(SinglePropertyEditorPanelBase, metaclass=guiHelper.SIP
 			+ hideable["hideIfNotTEXT"]
 		):
 			item.Show(False)
+		# Indexed as per `self._editorTypeIndex`
+		self._hideableByEditorType = tuple(
+			hideable[f"hideIfNot{editorType.name}"] for editorType in EditorType
+		)
+		self._editorTypeIndex = {editorType: index for index, editorType in enumerate(EditorType)}
+		self._editorByEditorType = {
+			EditorType.CHECKBOX: self.editor_checkBox,
+			EditorType.CHOICE: self.editor_choice_ctrl,
+			EditorType.TEXT: self.editor_text_ctrl,
+		}
+		self._editorLabelByEditorType = {
+			EditorType.CHECKBOX: self.editor_checkBox,
+			EditorType.CHOICE: self.editor_choice_label,
+			EditorType.TEXT: self.editor_text_label,
+		}
 
 		gbSizer.AddGrowableCol(2)
 		gbSizer.FitInside(self)
@@ -448,44 +622,76 @@ class PropertiesPanelBase(SinglePropertyEditorPanelBase, metaclass=guiHelper.SIP
 			listCtrl.SetColumnWidth(i, autoSize)
 		self._sendLayoutUpdatedEvent()
 	
-	def listCtrl_insert(self, index: int, prop: Property) -> None:
-		listCtrl = self.listCtrl
-		listCtrl.InsertStringItem(index, prop.displayName)
-		listCtrl.SetStringItem(index, 1, prop.displayValue)
+	def listCtrl_getRow(self, prop: Property) -> tuple[str, ...]:
+		"""The text of each cell of the row for the given property.
+		"""
+		return prop.displayName, prop.displayValue
 	
 	def listCtrl_update_all(self):
 		selectedProp = self.prop
 		props = self.props
 		listCtrl = self.listCtrl
-		listCtrl.DeleteAllItems()
+		oldRows = self._listCtrl_rows
+		newRows = self._listCtrl_rows = []
 		selectIndex = 0
 		for index, prop in enumerate(props):
-			self.listCtrl_insert(index, prop)
+			newRows.append(self.listCtrl_getRow(prop))
 			if selectedProp and selectedProp.name == prop.name:
 				selectIndex = index
-		hideable = self.hideable
-		if props:
-			listCtrl.Select(selectIndex)
-			listCtrl.Focus(selectIndex)
-		else:
-			for editorType in EditorType:
-				for item in hideable[f"hideIfNot{editorType.name}"]:
-					item.Show(False)
-		supported = len(props.getSupportedPropertiesName())
-		self.panelDescription = "" if supported else self.descriptionIfNoneSupported
-		for item in self.hideable["hideIfNoneSupported"]:
-			item.Show(supported)
-		for item in self.hideable["hideIfSupported"]:
-			item.Show(not supported)
+		self.Freeze()
+		try:
+			if (
+				len(oldRows) == len(newRows) == listCtrl.ItemCount
+				and all(old[0] == new[0] for old, new in zip(oldRows, newRows))
+			):
+				# Same properties as before: Only update the changed cells
+				for index, (old, new) in enumerate(zip(oldRows, newRows)):
+					for col in range(1, len(new)):
+						if old[col] != new[col]:
+							listCtrl.SetStringItem(index, col, new[col])
+			else:
+				listCtrl.DeleteAllItems()
+				self._listCtrl_selectedIndex = -1
+				for index, row in enumerate(newRows):
+					listCtrl.InsertStringItem(index, row[0])
+					for col in range(1, len(row)):
+						listCtrl.SetStringItem(index, col, row[col])
+			if props:
+				# Selecting also focuses, see `onListCtrl_itemSelected`
+				if selectIndex != self._listCtrl_selectedIndex:
+					listCtrl.Select(selectIndex)
+				else:
+					# The container might have been replaced: Rebind to its own property
+					prop = props[selectIndex]
+					if prop is not selectedProp:
+						self.prop = prop
+			else:
+				for items in self._hideableByEditorType:
+					for item in items:
+						item.Show(False)
+				self._shownEditorType = None
+			supported = len(props.getSupportedPropertiesName())
+			self.panelDescription = "" if supported else self.descriptionIfNoneSupported
+			for item in self.hideable["hideIfNoneSupported"]:
+				item.Show(supported)
+			for item in self.hideable["hideIfSupported"]:
+				item.Show(not supported)
+		finally:
+			self.Thaw()
 		self.listCtrl_setColumnWidthAutoSize()
 	
 	def listCtrl_update_value(self):
 		listCtrl = self.listCtrl
-		index = listCtrl.GetFirstSelected()
+		index = self._listCtrl_selectedIndex
+		if index == -1:
+			index = listCtrl.GetFirstSelected()
 		if index == -1:
 			raise Exception("wut?")  # FIXME
-		prop = self.props[index]
-		listCtrl.SetStringItem(index, 1, prop.displayValue)
+		# The edited property is the current one: No need to resolve it again by index
+		displayValue = self.prop.displayValue
+		listCtrl.SetStringItem(index, 1, displayValue)
+		row = self._listCtrl_rows[index]
+		self._listCtrl_rows[index] = (row[0], displayValue) + row[2:]
 		self.listCtrl_setColumnWidthAutoSize()
 	
 	def onEditor_change(self):
@@ -531,7 +737,7 @@ class PropertiesPanelBase(SinglePropertyEditorPanelBase, metaclass=guiHelper.SIP
 	
 	@guarded
 	def onListCtrl_itemSelected(self, evt):
-		index = evt.GetItem().GetId()
+		index = self._listCtrl_selectedIndex = evt.GetItem().GetId()
 		self.listCtrl.Focus(index)
 		self.prop = self.props[index]
 	
@@ -23,18 +23,44 @@
 __author__ = "Julien Cochuyt <j.cochuyt@accessolutions.fr>"
 
 
+import sys
+from typing import Any
+
 from gui import guiHelper
 
 from .. import ContextualSettingsPanel
 
 
+if sys.version_info[1] < 9:
+    from typing import Mapping
+else:
+    from collections.abc import Mapping
+
+
 class RuleAwarePanelBase(ContextualSettingsPanel, metaclass=guiHelper.SIPABCMeta):
 	
+	def __init__(self, *args, **kwargs):
+		# Resolved from the context upon first access, reset by `initData`
+		self._ruleData = None
+		self._ruleManager = None
+		super().__init__(*args, **kwargs)
+	
+	def initData(self, context: Mapping[str, Any]) -> None:
+		self._ruleData = None
+		self._ruleManager = None
+		super().initData(context)
+	
 	def getRuleData(self):
-		return self.context["data"].setdefault("rule", {})
+		ruleData = self._ruleData
+		if ruleData is None:
+			ruleData = self._ruleData = self.context["data"].setdefault("rule", {})
+		return ruleData
 	
 	def getRuleManager(self):
-		return self.context["webModule"].ruleManager
+		mgr = self._ruleManager
+		if mgr is None:
+			mgr = self._ruleManager = self.context["webModule"].ruleManager
+		return mgr
 	
 	def getRuleType(self):
 		return self.getRuleData().get("type")
@@ -33,7 +33,6 @@ from abc import abstractmethod
 from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from functools import partial
 import sys
 from typing import Any
 import wx
@@ -48,7 +47,7 @@ from logHandler import log
 import ui
 
 from ... import webModuleHandler
-from ...ruleHandler import RuleManager, builtinRuleActions, ruleTypes
+from ...ruleHandler import builtinRuleActions, ruleTypes
 from ...ruleHandler.controlMutation import (
 	MUTATIONS_BY_RULE_TYPE,
 	mutationLabels
@@ -67,6 +66,7 @@ from .. import (
 	stripAccel,
 	stripAccelAndColon,
 	stripAccelAndColon,
+	updateTextValue,
 )
 from ..actions import ActionsPanelBase
 from ..properties import (
@@ -87,18 +87,61 @@ else:
 
 addonHandler.initTranslation()
 
-formModeRoles = [
+formModeRoles = frozenset((
 	controlTypes.ROLE_EDITABLETEXT,
 	controlTypes.ROLE_COMBOBOX,
-]
+))
 
 SHARED_LABELS: Mapping[str, str] = {
 	# Translators: The Label for a field on the Rule editor
 	"type": _("Rule &type:"),
 	# Translators: The Label for a field on the Rule editor
 	"name": _("Rule &name:"),
+	# Translators: The label for a field on the Rule editor
+	"summary": _("Summar&y:"),
+	# Translators: The label for a field on the Rule editor
+	"comment": _("Technical n&otes:"),
 }
 
+# The rule types and their labels, in the order of the rule type choice
+_RULE_TYPE_KEYS: Sequence[str] = tuple(ruleTypes.ruleTypeLabels.keys())
+_RULE_TYPE_LABELS: Sequence[str] = tuple(ruleTypes.ruleTypeLabels.values())
+_RULE_TYPE_INDEXES: Mapping[str, int] = {key: index for index, key in enumerate(_RULE_TYPE_KEYS)}
+
+# Used when composing the Rule Summary report
+_TYPE_LABEL_PLAIN = stripAccel(SHARED_LABELS["type"])
+# Translators: The label for a section on the Rule Summary report
+_formatSectionHeader = _("{section}:").format
+# Translators: A mention on the Rule Summary report
+_formatFieldValue = _("{field}: {value}").format
+
+
+def getEditableWebModule(context):
+	"""Resolve the Web Module and layer name the edited rule is to be saved to.
+	
+	The result of a successful resolution is stored in the context, so that validation
+	and save share it, along with the eventual prompt for masking.
+	"""
+	try:
+		return context["editableWebModule"]
+	except KeyError:
+		pass
+	rule = context.get("rule")
+	layerName = rule.layer if rule is not None else None
+	webModule = webModuleHandler.getEditableWebModule(
+		context["webModule"].ruleManager.webModule,
+		layerName=layerName
+	)
+	if not webModule:
+		return webModule, layerName
+	if layerName == "addon":
+		if not webModule.getLayer("addon") and webModule.getLayer("scratchpad"):
+			layerName = "scratchpad"
+	elif layerName is None:
+		layerName = webModule._getWritableLayer().name
+	context["editableWebModule"] = webModule, layerName
+	return webModule, layerName
+
 
 def getSummary(context, data):
 	ruleType = data.get("type")
@@ -107,21 +150,21 @@ def getSummary(context, data):
 		return _("No rule type selected.")
 	parts = []
 	parts.append("{} {}".format(
-		stripAccel(SHARED_LABELS["type"]),
+		_TYPE_LABEL_PLAIN,
 		ruleTypes.ruleTypeLabels.get(ruleType, "")
 	))
 
 	# Properties
 	subParts = []
-	props = Properties(context, data.get("properties", {}), iterOnlyFirstMap=True)
-	for prop in props:
-		subParts.append(
-			# Translators: A mention on the Rule Summary report
-			"  " + _("{field}: {value}").format(field=prop.displayName, value=prop.displayValue)
-		)
+	propsData = data.get("properties")
+	# Only the properties defined in the rule are listed: No need for a container if there is none
+	if propsData:
+		for prop in Properties(context, propsData, iterOnlyFirstMap=True):
+			subParts.append(
+				"  " + _formatFieldValue(field=prop.displayName, value=prop.displayValue)
+			)
 	if subParts:
-		# Translators: The label for a section on the Rule Summary report
-		parts.append(_("{section}:").format(section=PropertiesPanel.title))
+		parts.append(_formatSectionHeader(section=PropertiesPanel.title))
 		parts.extend(subParts)
 
 	# Criteria
@@ -135,15 +178,17 @@ def getSummary(context, data):
 		else:
 			# Translators: The label for a section on the Rule Summary report
 			parts.append(_("Multiple criteria sets:"))
+			# Translators: The label for a section on the Rule Summary report
+			formatNamedHeader = _('Alternative #{index} "{name}":').format
+			# Translators: The label for a section on the Rule Summary report
+			formatHeader = _("Alternative #{index}:").format
 			for index, alternative in enumerate(criteriaSets):
 				name = alternative.get("name")
 				if name:
-					# Translators: The label for a section on the Rule Summary report
-					altHeader = _('Alternative #{index} "{name}":').format(index=index, name=name)
+					altHeader = formatNamedHeader(index=index, name=name)
 				else:
-					# Translators: The label for a section on the Rule Summary report
-					altHeader = _("Alternative #{index}:").format(index=index)
-				subParts.append("  " + altHeader)
+					altHeader = formatHeader(index=index)
+				subParts.append(f"  {altHeader}")
 				subParts.append(criteriaEditor.getSummary(context, alternative, indent="    "))
 		parts.extend(subParts)
 	return "\n".join(parts)
@@ -156,19 +201,49 @@ class RuleEditorTreeContextualPanel(RuleAwarePanelBase, TreeContextualPanel):
 	
 	def onRuleType_change(self):
 		prm = self.categoryParams
-		categoryClasses = tuple(nodeInfo.categoryClass for nodeInfo in self.Parent.Parent.categoryClasses)
-		for index in (categoryClasses.index(cls) for cls in (ActionsPanel, PropertiesPanel)):
+		dialog = self.Parent.Parent
+		# The shared properties container caches the rule type to filter the supported properties
+		dialog.getProperties().invalidate()
+		for index in (dialog.getCategoryIndex(cls) for cls in (ActionsPanel, PropertiesPanel)):
 			category = prm.tree.getXChild(prm.tree.GetRootItem(), index)
 			self.refreshParent(category)
 
 
 class RuleEditorSingleFieldChildPanel(SingleFieldEditorPanelBase, RuleEditorTreeContextualPanel):
-	pass
+	
+	# The rule type is the only choice field: Use the precomputed sequences
+	
+	def getEditorChoiceIndex(self, value):
+		if self.editorChoices is not ruleTypes.ruleTypeLabels:
+			return super().getEditorChoiceIndex(value)
+		try:
+			return _RULE_TYPE_INDEXES[value]
+		except KeyError:
+			raise ValueError(f"{value!r} not in {self.editorChoices!r}")
+	
+	def getEditorChoiceLabels(self):
+		if self.editorChoices is not ruleTypes.ruleTypeLabels:
+			return super().getEditorChoiceLabels()
+		return _RULE_TYPE_LABELS
+	
+	def getEditorChoiceValue(self, index):
+		if self.editorChoices is not ruleTypes.ruleTypeLabels:
+			return super().getEditorChoiceValue(index)
+		return _RULE_TYPE_KEYS[index]
 
 
 class GeneralPanel(RuleEditorTreeContextualPanel):
 	# Translators: The label for the General settings panel.
 	title = _("General")
+	
+	# Delay in milliseconds used to coalesce successive summary refresh requests
+	REFRESH_SUMMARY_DELAY = 150
+
+	def __init__(self, *args, **kwargs):
+		self._refreshSummaryLater: wx.CallLater = None
+		# The last computed summary, along with the representation of the data it was computed from
+		self._summaryCache: tuple[str, str] = (None, None)
+		super().__init__(*args, **kwargs)
 
 	def makeSettings(self, settingsSizer):
 		scale = self.scale
@@ -182,7 +257,7 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 		gbSizer.Add(scale(guiHelper.SPACE_BETWEEN_ASSOCIATED_CONTROL_HORIZONTAL, 0), pos=(row, 1))
 		item = self.ruleType = wx.Choice(
 			self,
-			choices=list(ruleTypes.ruleTypeLabels.values())
+			choices=_RULE_TYPE_LABELS
 		)
 		item.Bind(wx.EVT_CHOICE, self.onRuleType_choice)
 		# todo: change tooltip's text
@@ -205,20 +280,18 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_VERTICAL_DIALOG_ITEMS), pos=(row, 0))
 
 		row += 1
-		# Translators: The label for a field on the Rule editor
-		item = wx.StaticText(self, label=_("Summar&y:"))
+		item = wx.StaticText(self, label=SHARED_LABELS["summary"])
 		gbSizer.Add(item, pos=(row, 0))
 		gbSizer.Add(scale(guiHelper.SPACE_BETWEEN_ASSOCIATED_CONTROL_HORIZONTAL, 0), pos=(row, 1))
 		item = self.summaryText = ExpandoTextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
-		item.Bind(EVT_ETC_LAYOUT_NEEDED, lambda evt: self._sendLayoutUpdatedEvent())
+		item.Bind(EVT_ETC_LAYOUT_NEEDED, self.onLayoutNeeded)
 		gbSizer.Add(item, pos=(row, 2), span=(2, 1), flag=wx.EXPAND)
 
 		row += 2
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_VERTICAL_DIALOG_ITEMS), pos=(row, 0))
 
 		row += 1
-		# Translator: The label for a field on the Rule editor
-		item = wx.StaticText(self, label=_("Technical n&otes:"))
+		item = wx.StaticText(self, label=SHARED_LABELS["comment"])
 		gbSizer.Add(item, pos=(row, 0))
 		item = self.commentText = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_RICH)
 		gbSizer.Add(item, pos=(row, 2), span=(2, 1), flag=wx.EXPAND)
@@ -229,9 +302,10 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 
 	def initData(self, context: Mapping[str, Any]) -> None:
 		super().initData(context)
+		self._summaryCache = (None, None)
 		data = self.getData()
 		if 'type' in data:
-			self.ruleType.SetSelection(list(ruleTypes.ruleTypeLabels.keys()).index(data['type']))
+			self.ruleType.SetSelection(_RULE_TYPE_INDEXES[data['type']])
 		else:
 			self.ruleType.SetSelection(0)
 
@@ -242,10 +316,9 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 
 	@staticmethod
 	def initRuleTypeChoice(data, ruleTypeChoice):
-		for index, key in enumerate(ruleTypes.ruleTypeLabels.keys()):
-			if key == data["type"]:
-				ruleTypeChoice.Selection = index
-				break
+		index = _RULE_TYPE_INDEXES.get(data["type"])
+		if index is not None:
+			ruleTypeChoice.Selection = index
 
 	def updateData(self):
 		data = self.getData()
@@ -262,45 +335,82 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 		data = self.getData()
 		value = data["name"] = self.ruleName.Value.strip()
 		prm = self.categoryParams
-		for index, childPrm in enumerate(
-			child.categoryParams
-			for child in prm.tree.getTreeNodeInfo(prm.treeNode).children
-		):
+		tree = prm.tree
+		# Walk the existing child nodes rather than rebuilding them through `TreeNodeInfo.children`
+		for nodeId in tree.iterChildren(prm.treeNode):
+			nodeInfo = tree.getTreeNodeInfo(nodeId)
+			childPrm = nodeInfo.categoryParams
 			if childPrm.fieldName == "name":
 				break
 		else:
 			raise Exception("Could not find child TreeNode for updating")
-			return
-		nodeId = prm.tree.getXChild(prm.treeNode, index)
-		nodeInfo = prm.tree.getTreeNodeInfo(nodeId)
-		cls = nodeInfo.categoryClass.func  # This is a partial
-		prm.tree.SetItemText(nodeId, cls.getTreeNodeLabel(childPrm.fieldDisplayName, value))
+		cls = nodeInfo.categoryClass
+		tree.SetItemText(nodeId, cls.getTreeNodeLabel(childPrm.fieldDisplayName, value))
 
 	@guarded
 	def onRuleType_choice(self, evt):
 		data = self.getData()
 		data["type"] = self.getTypeFieldValue()
-		self.refreshSummary()
+		self.scheduleRefreshSummary()
 		self.onRuleType_change()
 
 	def getTypeFieldValue(self):
-		return tuple(ruleTypes.ruleTypeLabels.keys())[self.ruleType.Selection]
+		return _RULE_TYPE_KEYS[self.ruleType.Selection]
 
 	def getSummary(self):
 		if not self.context:
 			return "nope"
-		data = self.getData().copy()
-		for panel in list(self.Parent.Parent.catIdToInstanceMap.values()):
-			panel.updateData()
-		return getSummary(self.context, data)
+		# The other panels already flushed their data when deactivated.
+		# The current category is not yet assigned while the first panel is being initialized.
+		category = self.Parent.Parent.currentCategory
+		if category is not None and category is not self:
+			category.updateData()
+		# Read-only access: No need for a copy
+		data = self.getData()
+		# The rule data only holds plain values: Its representation is a faithful fingerprint
+		key = repr(data)
+		cachedKey, summary = self._summaryCache
+		if key != cachedKey:
+			summary = getSummary(self.context, data)
+			self._summaryCache = (key, summary)
+		return summary
+
+	def cancelRefreshSummary(self):
+		later = self._refreshSummaryLater
+		if later is not None and later.IsRunning():
+			later.Stop()
 
 	def refreshSummary(self):
-		self.summaryText.Value = self.getSummary()
+		self.cancelRefreshSummary()
+		# Setting the value of the ExpandoTextCtrl triggers a layout, even if unchanged
+		updateTextValue(self.summaryText, self.getSummary())
+
+	def scheduleRefreshSummary(self):
+		"""Refresh the summary after a short delay, restarted upon each call.
+		"""
+		later = self._refreshSummaryLater
+		if later is None:
+			self._refreshSummaryLater = wx.CallLater(self.REFRESH_SUMMARY_DELAY, self.onRefreshSummaryLater)
+		else:
+			later.Restart(self.REFRESH_SUMMARY_DELAY)
+
+	@guarded
+	def onRefreshSummaryLater(self):
+		# The panel might have been destroyed in the meantime.
+		# If hidden, the summary is refreshed anyway upon activation.
+		if not self or not self.IsShownOnScreen():
+			return
+		self.refreshSummary()
 
 	def onPanelActivated(self):
 		self.refreshSummary()
 		super().onPanelActivated()
 
+	def onPanelDeactivated(self):
+		# The summary is refreshed anew upon activation
+		self.cancelRefreshSummary()
+		super().onPanelDeactivated()
+
 	def isValid(self):
 		self.updateData()
 		data = self.getData()
@@ -330,34 +440,24 @@ class GeneralPanel(RuleEditorTreeContextualPanel):
 			return False
 
 		mgr = self.getRuleManager()
-		layerName = self.context["rule"].layer if "rule" in self.context else None
-		webModule = webModuleHandler.getEditableWebModule(mgr.webModule, layerName=layerName)
+		webModule, layerName = getEditableWebModule(self.context)
 		if not webModule:
 			return False
-		if layerName == "addon":
-			if not webModule.getLayer("addon") and webModule.getLayer("scratchpad"):
-				layerName = "scratchpad"
-		elif layerName is None:
-			layerName = webModule._getWritableLayer().name
 		if layerName is None:
 			layerName = False
 		try:
 			rule = mgr.getRule(self.ruleName.Value, layer=layerName)
 		except LookupError:
 			rule = None
-		if rule is not None:
-			moduleRules = self.getRuleManager().getRules()
-			isExists = [True if i.name is rule.name else False for i in moduleRules]
-			if "new" in self.context and self.context["new"]:
-				if isExists:
-					gui.messageBox(
-						# Translators: Error message when another rule with the same name already exists
-						message=_("There already is another rule with the same name."),
-						caption=_("Error"),
-						style=wx.ICON_ERROR | wx.OK,
-						parent=self
-					)
-					return False
+		if rule is not None and self.context.get("new"):
+			gui.messageBox(
+				# Translators: Error message when another rule with the same name already exists
+				message=_("There already is another rule with the same name."),
+				caption=_("Error"),
+				style=wx.ICON_ERROR | wx.OK,
+				parent=self
+			)
+			return False
 		return True
 
 
@@ -394,20 +494,18 @@ class AlternativesPanel(RuleEditorTreeContextualPanel):
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_VERTICAL_DIALOG_ITEMS), pos=(row, 0))
 		
 		row += 1
-		# Translators: The label for a field on the Rule editor
-		item = wx.StaticText(self, label=_("Summar&y:"))
+		item = wx.StaticText(self, label=SHARED_LABELS["summary"])
 		gbSizer.Add(item, pos=(row, 0))
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_ASSOCIATED_CONTROL_HORIZONTAL), pos=(row, 1))
 		item = self.summaryText = ExpandoTextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
-		item.Bind(EVT_ETC_LAYOUT_NEEDED, lambda evt: self._sendLayoutUpdatedEvent())
+		item.Bind(EVT_ETC_LAYOUT_NEEDED, self.onLayoutNeeded)
 		gbSizer.Add(item, pos=(row, 2), span=(2, 1), flag=wx.EXPAND)
 		
 		row += 2
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_VERTICAL_DIALOG_ITEMS), pos=(row, 0))
 		
 		row += 1
-		# Translators: The label for a field on the Rule editor
-		item = wx.StaticText(self, label=_("Technical n&otes:"))
+		item = wx.StaticText(self, label=SHARED_LABELS["comment"])
 		gbSizer.Add(item, pos=(row, 0))
 		gbSizer.Add(scale(0, guiHelper.SPACE_BETWEEN_ASSOCIATED_CONTROL_HORIZONTAL), pos=(row, 1))
 		item = self.commentText = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
@@ -460,10 +558,7 @@ class AlternativesPanel(RuleEditorTreeContextualPanel):
 
 	@staticmethod
 	def getCriteriaName(criteria):
-		if criteria.get("name"):
-			return criteria["name"]
-		else:
-			return criteriaEditor.getSummary_context(criteria)[0]
+		return criteria.get("name") or criteriaEditor.getSummary_contextFirst(criteria)
 
 	def spaceIsPressedOnTreeNode(self, withShift=False):
 		if self.getData():
@@ -475,33 +570,43 @@ class AlternativesPanel(RuleEditorTreeContextualPanel):
 		return self.criteriaList.Selection
 
 	def onCriteriaChange(self, change: Change, index: int):
-		self.updateCriteriaList(index)
+		ctrl = self.criteriaList
+		# The list still selects the edited alternative: Check whether it has been moved
+		if change is Change.UPDATE and index == ctrl.Selection:
+			ctrl.SetString(index, self.getCriteriaName(self.getData()[index]))
+			self.onCriteriaSelected(None)
+		else:
+			self.updateCriteriaList(index)
 		self.refreshParent(self.categoryParams.treeNode)
 
 	@guarded
 	def onNewCriteria(self, evt):
 		context = self.context
 		prm = self.categoryParams
-		context["data"]["criteria"] = OrderedDict({
+		data = context["data"]
+		alternatives = data["rule"]["criteria"]
+		data["criteria"] = OrderedDict({
 			"new": True,
-			"criteriaIndex": len(context["data"]["rule"]["criteria"])
+			"criteriaIndex": len(alternatives)
 		})
 		if criteriaEditor.show(context, parent=self) == wx.ID_OK:
-			context["data"]["criteria"].pop("new", None)
-			index = context["data"]["criteria"].pop("criteriaIndex")
-			context["data"]["rule"]["criteria"].insert(index, context["data"].pop("criteria"))
+			data["criteria"].pop("new", None)
+			index = data["criteria"].pop("criteriaIndex")
+			alternatives.insert(index, data.pop("criteria"))
 			self.onCriteriaChange(Change.CREATION, index)
 
 	@guarded
 	def onEditCriteria(self, evt):
 		context = self.context
 		index = self.getIndex()
-		context["data"]["criteria"] = context["data"]["rule"]["criteria"][index].copy()
-		context["data"]["criteria"]["criteriaIndex"] = index
+		data = context["data"]
+		alternatives = data["rule"]["criteria"]
+		data["criteria"] = alternatives[index].copy()
+		data["criteria"]["criteriaIndex"] = index
 		if criteriaEditor.show(context, self) == wx.ID_OK:
-			del context["data"]["rule"]["criteria"][index]
-			index = context["data"]["criteria"].pop("criteriaIndex")
-			context["data"]["rule"]["criteria"].insert(index, context["data"].pop("criteria"))
+			del alternatives[index]
+			index = data["criteria"].pop("criteriaIndex")
+			alternatives.insert(index, data.pop("criteria"))
 			self.onCriteriaChange(Change.UPDATE, index)
 
 	@guarded
@@ -523,8 +628,8 @@ class AlternativesPanel(RuleEditorTreeContextualPanel):
 		self.editButton.Enable(True)
 		self.deleteButton.Enable(True)
 		data = self.getData()[self.criteriaList.Selection]
-		self.summaryText.Value = criteriaEditor.getSummary(self.context, data)
-		self.commentText.Value = data.get("comment", "")
+		updateTextValue(self.summaryText, criteriaEditor.getSummary(self.context, data))
+		updateTextValue(self.commentText, data.get("comment", ""))
 
 	@staticmethod
 	def getTreeNodeLabel(criteria):
@@ -535,16 +640,14 @@ class AlternativesPanel(RuleEditorTreeContextualPanel):
 		ctrl = self.criteriaList
 		if index is None:
 			index = max(ctrl.Selection, 0)
-		ctrl.Clear()
-		for criteria in data:
-			ctrl.Append(self.getCriteriaName(criteria))
+		ctrl.Set([self.getCriteriaName(criteria) for criteria in data])
 		if data:
 			index = min(index, len(data) - 1)
 			ctrl.Select(index)
 			self.onCriteriaSelected(None)
 		else:
-			self.summaryText.Value = ""
-			self.commentText.Value = ""
+			updateTextValue(self.summaryText, "")
+			updateTextValue(self.commentText, "")
 			self.editButton.Disable()
 			self.deleteButton.Disable()
 
@@ -572,17 +675,14 @@ class ActionsPanel(ActionsPanelBase, RuleEditorTreeContextualPanel):
 	def onAutoActionChoice(self, evt):
 		super().onAutoActionChoice(evt)
 		# Refresh ChildProperty tree node label
-		index = tuple(
-			nodeInfo.categoryClass
-			for nodeInfo in self.Parent.Parent.categoryClasses
-		).index(PropertiesPanel)
+		dialog = self.Parent.Parent
 		prm = self.categoryParams
-		propsCat = prm.tree.getXChild(prm.tree.GetRootItem(), index)
-		data = super().getData()
-		props = Properties(self.context, data)
-		index = tuple(p.name for p in props).index("autoAction")
-		prm.tree.SetItemText(
-			prm.tree.getXChild(propsCat, index),
+		tree = prm.tree
+		propsCat = tree.getXChild(tree.GetRootItem(), dialog.getCategoryIndex(PropertiesPanel))
+		props = dialog.getProperties()
+		index = props.getIndex("autoAction")
+		tree.SetItemText(
+			tree.getXChild(propsCat, index),
 			ChildPropertyPanel.getTreeNodeLabelForProp(props[index])
 		)
 
@@ -591,7 +691,7 @@ class PropertiesPanel(PropertiesPanelBase, RuleEditorTreeContextualPanel):
 	
 	# Called by SinglePropertyEditorPanelBase.initData
 	def initData_properties(self):
-		self.props = Properties(self.context, self.getData())
+		self.props = self.Parent.Parent.getProperties()
 	
 	# Overrides SingleFieldEditorMixin's
 	def onEditor_change(self, reset=False):
@@ -599,7 +699,7 @@ class PropertiesPanel(PropertiesPanelBase, RuleEditorTreeContextualPanel):
 		prm = self.categoryParams
 		# Refreshing all child nodes is too slow for quick editing
 		prm.tree.SetItemText(
-			prm.tree.getXChild(prm.treeNode, tuple(p.name for p in self.props).index(self.prop.name)),
+			prm.tree.getXChild(prm.treeNode, self.props.getIndex(self.prop.name)),
 			ChildPropertyPanel.getTreeNodeLabelForProp(self.prop)
 		)
 
@@ -622,7 +722,7 @@ class ChildAlternativePanel(AlternativesPanel):
 		row += 1
 		summaryStartRow = row
 		item = self.summaryText = ExpandoTextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
-		item.Bind(EVT_ETC_LAYOUT_NEEDED, lambda evt: self._sendLayoutUpdatedEvent())
+		item.Bind(EVT_ETC_LAYOUT_NEEDED, self.onLayoutNeeded)
 		gbSizer.Add(item, pos=(row, 0), span=(5, 1), flag=wx.EXPAND)
 		
 		row += 5
@@ -681,8 +781,8 @@ class ChildAlternativePanel(AlternativesPanel):
 		prm = self.categoryParams
 		self.indexCriteria = prm.tree.getSelectionIndex()
 		data = self.getData()[self.indexCriteria]
-		self.summaryText.Value = criteriaEditor.getSummary(self.context, data)
-		self.commentText.Value = data.get("comment", "")
+		updateTextValue(self.summaryText, criteriaEditor.getSummary(self.context, data))
+		updateTextValue(self.commentText, data.get("comment", ""))
 
 	def initData_alternatives(self) -> None:
 		pass
@@ -711,17 +811,17 @@ class ChildAlternativePanel(AlternativesPanel):
 
 class ChildActionPanel(RuleEditorTreeContextualPanel):
 
-	@dataclass
+	@dataclass(slots=True)
 	class CategoryParams(TreeContextualPanel.CategoryParams):
 		title: str = None
 		gestureIdentifier: str = None
 	
 	@staticmethod
-	def getTreeNodeLabel(mgr: RuleManager, gestureIdentifier, action):
+	def getTreeNodeLabel(actions: Mapping[str, str], gestureIdentifier, action):
 		gestureSource, gestureMain = inputCore.getDisplayTextForGestureIdentifier(gestureIdentifier)
 		# Translators: A gesture binding on the editor dialogs
 		return "{gesture}: {action}".format(
-			gesture=gestureMain, action=mgr.getActions().get(action, f"*{action}")
+			gesture=gestureMain, action=actions.get(action, f"*{action}")
 		)
 	
 	def makeSettings(self, sizer):
@@ -793,7 +893,7 @@ class ChildActionPanel(RuleEditorTreeContextualPanel):
 		prm = self.categoryParams
 		gestures = self.getData()
 		id = prm.gestureIdentifier
-		index = tuple(gestures.keys()).index(id)
+		index = next(index for index, key in enumerate(gestures) if key == id)
 		del gestures[id]
 		if index >= len(gestures):
 			index -= 1
@@ -842,7 +942,7 @@ class ChildPropertyPanel(
 	
 	# Called by SinglePropertyEditorPanelBase.initData
 	def initData_properties(self):
-		self.props = Properties(self.context, self.getData())
+		self.props = self.Parent.Parent.getProperties()
 	
 	# called by TreeMultiCategorySettingsDialog.onKeyDown
 	def delete(self):
@@ -873,6 +973,8 @@ class RuleEditorDialog(TreeMultiCategorySettingsDialog):
 		# kwargs["initialCategory"] = GeneralPanel
 		super().__init__(*args, **kwargs)
 		self.isCreation = False
+		# The properties data and the container over it, see `getProperties`
+		self._propertiesCache: tuple[Mapping[str, Any], Properties] = (None, None)
 
 	def getGeneralChildren(self):
 		cls = RuleEditorSingleFieldChildPanel
@@ -880,11 +982,12 @@ class RuleEditorDialog(TreeMultiCategorySettingsDialog):
 		data.setdefault("type", ruleTypes.MARKER)
 		return tuple(
 			TreeNodeInfo(
-				partial(cls, editorType=editorType),
+				cls,
 				title=cls.getTreeNodeLabel(
 					prm.fieldDisplayName, data.get(prm.fieldName), prm.editorChoices
 				),
-				categoryParams=prm
+				categoryParams=prm,
+				categoryKwargs={"editorType": editorType},
 			)
 			for editorType, prm in (
 				(EditorType.CHOICE, cls.CategoryParams(
@@ -917,44 +1020,61 @@ class RuleEditorDialog(TreeMultiCategorySettingsDialog):
 	def getActionsChildren(self):
 		ruleData = self.context['data']['rule']
 		type = ruleData.get('type', '')
-		if type not in [ruleTypes.ZONE, ruleTypes.MARKER]:
+		if type not in ruleTypes.ACTION_TYPES:
 			return []
-		mgr = self.context["webModule"].ruleManager
+		# Retrieved once: `RuleManager.getActions` scans the web module's attributes
+		actions = self.context["webModule"].ruleManager.getActions()
 		actionsPanel = []
 		for key, value in ruleData.get('gestures', {}).items():
-			title = ChildActionPanel.getTreeNodeLabel(mgr, key, value)
+			title = ChildActionPanel.getTreeNodeLabel(actions, key, value)
 			prm = ChildActionPanel.CategoryParams(title=title, gestureIdentifier=key)
 			actionsPanel.append(TreeNodeInfo(ChildActionPanel, title=title, categoryParams=prm))
 		return actionsPanel
 
+	def getProperties(self) -> Properties:
+		"""Retrieve the properties container shared by the panels of this dialog.
+		
+		It is created anew only if the underlying data has been replaced.
+		Otherwise, it is invalidated as the rule type might have changed in the meantime,
+		which then marks it as changed for the next `updateData`.
+		"""
+		data = self.context.setdefault("data", {}).setdefault("rule", {}).setdefault("properties", {})
+		cachedData, props = self._propertiesCache
+		if cachedData is not data:
+			props = Properties(self.context, data)
+			self._propertiesCache = (data, props)
+		else:
+			props.invalidate()
+		return props
+
 	def getPropertiesChildren(self) -> Sequence[TreeNodeInfo]:
-		context = self.context
-		data = context.setdefault("data", {}).setdefault("rule", {}).setdefault("properties", {})
-		props = Properties(context, data)
+		props = self.getProperties()
 		cls = ChildPropertyPanel
 		return tuple(
 			TreeNodeInfo(
-				partial(cls, prop=prop),
+				cls,
 				title=cls.getTreeNodeLabelForProp(prop),
 				categoryParams=cls.CategoryParams(),
+				categoryKwargs={"prop": prop},
 			)
 			for prop in props
 		)
 
 	def initData(self, context: Mapping[str, Any]) -> None:
 		rule = context.get("rule")
+		context.pop("editableWebModule", None)
+		self._propertiesCache = (None, None)
 		data = context.setdefault("data", {}).setdefault(
 			"rule",
 			rule.dump() if rule else {}
 		)
-		mgr = context["webModule"].ruleManager if "webModule" in context else None
+		webModule = context.get("webModule")
+		mgr = webModule.ruleManager if webModule is not None else None
 		if not rule and mgr and mgr.nodeManager:
-			node = mgr.nodeManager.getCaretNode()
-			while node is not None:
-				if node.role in formModeRoles:
-					data.setdefault("properties", {})["formMode"] = True
-					break
-				node = node.parent
+			nodeManager = mgr.nodeManager
+			node = nodeManager.getCaretNode()
+			if node is not None and nodeManager.hasAncestorWithRole(node, formModeRoles):
+				data.setdefault("properties", {})["formMode"] = True
 		super().initData(context)
 
 	def _doSave(self):
@@ -963,22 +1083,12 @@ class RuleEditorDialog(TreeMultiCategorySettingsDialog):
 		mgr = context["webModule"].ruleManager
 		data = context["data"]["rule"]
 		rule = context.get("rule")
-		layerName = rule.layer if rule is not None else None
-		webModule = webModuleHandler.getEditableWebModule(mgr.webModule, layerName=layerName)
+		# Usually already resolved while validating the General panel
+		webModule, layerName = getEditableWebModule(context)
+		context.pop("editableWebModule", None)
 		if not webModule:
 			return
-		if rule is not None:
-			# modification mode, remove old rule
-			mgr.removeRule(rule)
-		if layerName == "addon":
-			if not webModule.getLayer("addon") and webModule.getLayer("scratchpad"):
-				layerName = "scratchpad"
-		elif layerName is None:
-			layerName = webModule._getWritableLayer().name
-		
-		rule = webModule.createRule(data)
-		mgr.loadRule(layerName, rule.name, data)
-		webModule.getLayer(layerName, raiseIfMissing=True).dirty = True
+		mgr.replaceRule(rule, layerName, data)
 		webModuleHandler.save(webModule, layerName=layerName)
 
 
@@ -24,6 +24,7 @@ __author__ = "Shirley Noël <shirley.noel@pole-emploi.fr>"
 
 
 from collections import namedtuple
+from operator import attrgetter, itemgetter
 import wx
 
 import addonHandler
@@ -68,12 +69,25 @@ def show(context):
 
 
 TreeItemData = namedtuple("TreeItemData", ("label", "obj", "children"))
+_getLabel = attrgetter("label")
+
+# Cleared each time the Rules Manager is initialized, see `Dialog.initData`
+_gestureDisplayTexts = {}
+
+
+def getGestureDisplayText(identifier):
+	"""Cached `inputCore.getDisplayTextForGestureIdentifier`
+	
+	The tree is rebuilt upon each keystroke in the filter field, labelling every gesture each time.
+	"""
+	text = _gestureDisplayTexts.get(identifier)
+	if text is None:
+		text = _gestureDisplayTexts[identifier] = inputCore.getDisplayTextForGestureIdentifier(identifier)
+	return text
 
 
 def getGestureLabel(gesture):
-	source, main = inputCore.getDisplayTextForGestureIdentifier(
-		inputCore.normalizeGestureIdentifier(gesture)
-	)
+	source, main = getGestureDisplayText(inputCore.normalizeGestureIdentifier(gesture))
 	if gesture.startswith("kb:"):
 		return main
 	return "{main} ({source})".format(source=source, main=main)
@@ -83,8 +97,8 @@ def getRuleLabel(rule):
 	label = rule.name
 	if rule._gestureMap:
 		label += " ({gestures})".format(gestures=", ".join(
-			inputCore.getDisplayTextForGestureIdentifier(identifier)[1]
-			for identifier in list(rule._gestureMap.keys())
+			getGestureDisplayText(identifier)[1]
+			for identifier in rule._gestureMap
 		))
 	return label
 
@@ -134,21 +148,18 @@ def getRulesByGesture(ruleManager, filter=None, active=False):
 			noGesture.append(
 				TreeItemData(label=rule.name, obj=rule, children=[])
 			)
-	for gesture, tids in sorted(
-		list(gestures.items()),
-		key=lambda kvp: kvp[0]
-	):
+	for gesture, tids in sorted(gestures.items(), key=itemgetter(0)):
 		yield TreeItemData(
 			label=gesture,
 			obj=None,
-			children=sorted(tids, key=lambda tid: tid.label)
+			children=sorted(tids, key=_getLabel)
 		)
 	if noGesture:
 		yield TreeItemData(
 			# Translator: TreeItem label on the RulesManager dialog.
 			label=pgettext("webAccess.ruleGesture", "<None>"),
 			obj=None,
-			children=sorted(noGesture, key=lambda tid: tid.label)
+			children=sorted(noGesture, key=_getLabel)
 		)
 
 
@@ -254,7 +265,7 @@ def getRulesByType(ruleManager, filter=None, active=False):
 		yield TreeItemData(
 			label=label,
 			obj=None,
-			children=sorted(tids, key=lambda tid: tid.label)
+			children=sorted(tids, key=_getLabel)
 		)
 
 
@@ -428,6 +439,9 @@ class Dialog(wx.Dialog, ScalingMixin):
 	def initData(self, context):
 		global lastGroupBy, lastActiveOnly
 		self.context = context
+		_gestureDisplayTexts.clear()
+		# Keyed by rule: Editing a rule replaces it with a new instance
+		self._ruleSummaries = {}
 		ruleManager = self.ruleManager = context["webModule"].ruleManager
 		webModule = ruleManager.webModule
 		title = "Web Module - {}".format(webModule.name)
@@ -648,10 +662,13 @@ class Dialog(wx.Dialog, ScalingMixin):
 			self.resultMoveToButton.Enabled = bool(rule_getResults_safe(rule))
 			self.ruleDeleteButton.Enabled = True
 			self.ruleEditButton.Enabled = True
-			# Mapping union was added only in Python 3.9
-			context = self.context.copy()
-			context["rule"] = rule
-			self.ruleSummary.Value = getSummary(context, rule.dump())
+			summary = self._ruleSummaries.get(rule)
+			if summary is None:
+				# Mapping union was added only in Python 3.9
+				context = self.context.copy()
+				context["rule"] = rule
+				summary = self._ruleSummaries[rule] = getSummary(context, rule.dump())
+			self.ruleSummary.Value = summary
 			self.ruleComment.Value = rule.comment or ""
 
 	def ShowModal(self, context):
@@ -62,6 +62,35 @@ def promptOverwrite():
 		) == wx.YES
 
 
+# The name of the store new Web Modules are created in, per relevant configuration
+_creationStoreNames = {}
+
+
+def getCreationStoreName():
+	"""Retrieve the name of the store a new Web Module would be created in.
+	
+	Used in Developer Mode for the title of the creation dialog.
+	Resolving it requires a throw-away Web Module, hence the result is cached.
+	"""
+	key = (
+		config.conf["webAccess"]["disableUserConfig"],
+		config.conf["webAccess"]["devMode"],
+		config.conf["development"]["enableScratchpadDir"],
+	)
+	try:
+		return _creationStoreNames[key]
+	except KeyError:
+		pass
+	from .. import webModuleHandler
+	guineaPig = getEditableWebModule(WebModule(), prompt=False)
+	store = next(iter(webModuleHandler.store.getSupportingStores(
+		"create",
+		item=guineaPig
+	))) if guineaPig is not None else None
+	name = _creationStoreNames[key] = store and ("user" if store.name == "userConfig" else store.name)
+	return name
+
+
 def show(context):
 	gui.mainFrame.prePopup()
 	result = Dialog(gui.mainFrame).ShowModal(context)
@@ -164,26 +193,19 @@ class Dialog(wx.Dialog, ScalingMixin):
 				new = False
 			else:
 				new = True
+		devMode = config.conf["webAccess"]["devMode"]
 		if new:
 			# Translators: Web module creation dialog title
 			title = _("New Web Module")
-			if config.conf["webAccess"]["devMode"]:
-				from .. import webModuleHandler
+			if devMode:
 				try:
-					guineaPig = getEditableWebModule(WebModule(), prompt=False)
-					store = next(iter(webModuleHandler.store.getSupportingStores(
-						"create",
-						item=guineaPig
-					))) if guineaPig is not None else None
-					title += " ({})".format(
-						store and ("user" if store.name == "userConfig" else store.name)
-					)
+					title += " ({})".format(getCreationStoreName())
 				except Exception:
 					log.exception()
 		else:
 			# Translators: Web module edition dialog title
 			title = _("Edit Web Module")
-			if config.conf["webAccess"]["devMode"]:
+			if devMode:
 				title += " ({})".format("/".join((layer.name for layer in webModule.layers)))
 		self.Title = title
 
@@ -191,7 +191,7 @@ class Dialog(wx.Dialog, ScalingMixin):
 
 	def initData(self, context):
 		self.context = context
-		module = context["webModule"] if "webModule" in context else None
+		module = context.get("webModule")
 		self.refreshModulesList(selectItem=module)
 
 	def onModuleCreate(self, evt=None):
@@ -70,6 +70,8 @@ class NodeManager(baseObject.ScriptableObject):
 		self.index = nodeManagerIndex
 		self._ready = False
 		self.identifier = None
+		# Cleared whenever the nodes are parsed anew
+		self._hasAncestorWithRoleCache = {}
 		self.treeInterceptor = treeInterceptor
 		self.treeInterceptorSize = 0
 		self.mainNode = None
@@ -123,6 +125,7 @@ class NodeManager(baseObject.ScriptableObject):
 		self.callbackNodeMoveto = None
 		self.updating = False
 		self._curNode = self.caretNode = None
+		self._hasAncestorWithRoleCache.clear()
 
 	def formatAttributes(self, attrs):
 		s = ""
@@ -201,6 +204,7 @@ class NodeManager(baseObject.ScriptableObject):
 		self.fieldOffset = 0
 		self.lastTextNode = None
 		self.mainNode = None
+		self._hasAncestorWithRoleCache.clear()
 		# trace[:] = []
 		parser.Parse(XMLText.encode('utf-8'))
 
@@ -347,6 +351,23 @@ class NodeManager(baseObject.ScriptableObject):
 		except Exception:
 			return None
 
+	def hasAncestorWithRole(self, node, roles):
+		"""Whether the given node or one of its ancestors has one of the given roles.
+		
+		The result is cached until the next parsing, hence `roles` must be hashable.
+		"""
+		key = (id(node), roles)
+		result = self._hasAncestorWithRoleCache.get(key)
+		if result is None:
+			result = False
+			while node is not None:
+				if node.role in roles:
+					result = True
+					break
+				node = node.parent
+			self._hasAncestorWithRoleCache[key] = result
+		return result
+
 	def getCurrentNode(self):
 		if not self.isReady:
 			return None
@@ -645,8 +666,8 @@ class NodeField(TrackedObject):
 		nodeList = []
 		_count += 1
 		found = True
-		# Copy kwargs dict to get ready for Python 3:
-		for key, allowedValues in list(kwargs.copy().items()):
+		# Iterate over a snapshot of the items, as matched criteria are deleted from kwargs
+		for key, allowedValues in list(kwargs.items()):
 			if "_" not in key:
 				log.warning("Unexpected argument: {arg}".format(arg=key))
 				continue
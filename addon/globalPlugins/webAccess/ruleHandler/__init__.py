@@ -124,15 +124,16 @@ class DefaultScripts(baseObject.ScriptableObject):
 	def __init__(self, warningMessage):
 		super().__init__()
 		self.warningMessage = warningMessage
-		for ascii in range(ord("a"), ord("z")+1):
-			character = chr(ascii)
-			self.__class__.__gestures["kb:control+shift+%s" % character] = "notAssigned"
 
 	def script_notAssigned(self, gesture):
 		playWebAppSound("keyError")
 		callLater(200, ui.message, self.warningMessage)
 
-	__gestures = {}
+	# Populated once with the class rather than rewritten upon each instantiation
+	__gestures = {
+		"kb:control+shift+%s" % chr(ascii): "notAssigned"
+		for ascii in range(ord("a"), ord("z") + 1)
+	}
 
 
 class RuleManager(baseObject.ScriptableObject):
@@ -186,6 +187,10 @@ class RuleManager(baseObject.ScriptableObject):
 		if layer not in self._layers:
 			self._initLayer(layer, None)
 		self._loadRule(layer, name, data)
+		# A mask created for edition is not the Web Module this manager belongs to
+		webModuleLayer = self.webModule.getLayer(layer)
+		if webModuleLayer is not None:
+			webModuleLayer.dirty = True
 
 	def _loadRule(self, layer, name, data):
 		rule = self.webModule.createRule(data)
@@ -193,6 +198,20 @@ class RuleManager(baseObject.ScriptableObject):
 		self._layers[layer][name] = rule
 		self._rules.setdefault(name, {})[layer] = rule
 
+	def replaceRule(self, rule, layer, data):
+		"""Replace a rule with a new one created from the given data.
+		
+		If `rule` is `None`, the new rule is simply added.
+		If its name and layer are unchanged, the new rule overwrites it in place.
+		"""
+		name = data["name"]
+		if rule is not None:
+			if rule.name == name and rule.layer == layer:
+				self.removeResults(rule)
+			else:
+				self.removeRule(rule)
+		self.loadRule(layer, name, data)
+
 	def unload(self, layer):
 		for index in range(len(self._results)):
 			if self._results[index].rule.layer == layer:
@@ -36,9 +36,9 @@ import addonHandler
 
 
 if sys.version_info[1] < 9:
-    from typing import Iterator, Mapping, Sequence
+    from typing import Iterator, Mapping, Sequence, Set
 else:
-    from collections.abc import Iterator, Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence, Set
 
 
 addonHandler.initTranslation()
@@ -57,13 +57,17 @@ class PropertySpecValue:
 		"ruleTypes", "valueType", "default", "displayName", "displayValueIfUndefined", "isRestrictedChoice"
 	)
 	
-	ruleTypes: Sequence[str]  # Rule types for which the property is supported
+	ruleTypes: Set[str]  # Rule types for which the property is supported
 	valueType: type(PropertyValue)
 	default: PropertyValue
 	displayName: str | Mapping[Sequence[str], str]  # Can be different by rule type
 	displayValueIfUndefined: str
 	isRestrictedChoice: bool  # Currently applies only in the editor
 	
+	def __post_init__(self):
+		# Frequently tested for membership, order does not matter
+		self.ruleTypes = frozenset(self.ruleTypes)
+	
 	def getDisplayName(self, ruleType) -> str:
 		displayName = self.displayName
 		if isinstance(displayName, str):
@@ -165,12 +169,19 @@ class PropertySpec(Enum):
 	
 	@classmethod
 	def forRuleType(cls, ruleType: str) -> Sequence["PropertySpec"]:
-		return tuple(p for p in cls if ruleType in p.ruleTypes)
+		specs = _specsByRuleType.get(ruleType)
+		if specs is None:
+			specs = _specsByRuleType[ruleType] = tuple(p for p in cls if ruleType in p.ruleTypes)
+		return specs
 
 
 DEFAULT_VALUES = {p.name: p.default for p in PropertySpec}
 PROPERTY_NAMES = tuple(p.name for p in PropertySpec)
 
+# Lazily populated, see `PropertySpec.forRuleType` and `PropertiesBase.getSupportedPropertiesName`
+_specsByRuleType: Mapping[str, Sequence[PropertySpec]] = {}
+_supportedNamesByRuleType: Mapping[str, Sequence[str]] = {}
+
 
 class PropertiesBase(ABC):
 	"""ABC for property containers.
@@ -214,7 +225,13 @@ class PropertiesBase(ABC):
 		raise NotImplementedError
 	
 	def getSupportedPropertiesName(self) -> Sequence[str]:
-		return tuple(p.name for p in PropertySpec.forRuleType(self.ruleType))
+		ruleType = self.ruleType
+		names = _supportedNamesByRuleType.get(ruleType)
+		if names is None:
+			names = _supportedNamesByRuleType[ruleType] = tuple(
+				p.name for p in PropertySpec.forRuleType(ruleType)
+			)
+		return names
 	
 	def dump(self) -> Mapping[str, PropertyValue]:
 		"""Includes only the properties set in the first map, in the same order as their
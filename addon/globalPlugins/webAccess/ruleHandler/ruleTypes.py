@@ -37,6 +37,9 @@ PARENT = "parent"
 PAGE_TITLE_1 = "pageTitle1"
 PAGE_TITLE_2 = "pageTitle2"
 
+# The rule types supporting gestures and actions
+ACTION_TYPES = frozenset((MARKER, ZONE))
+
 
 ruleTypeLabels = {
 	# Translators: The label for a rule type.
@@ -143,10 +143,8 @@ class DispatchStore(Store):
 				ValueError("Unexpected ref format: {ref}".format(ref))
 		else:
 			storeKey = ref
-		store = None
-		if storeKey in self.storeDic:
-			store = self.storeDic[storeKey]
-		else:
+		store = self.storeDic.get(storeKey)
+		if store is None:
 			for candidate in self.stores:
 				if self.getStoreKey(candidate) == storeKey:
 					store = candidate
@@ -41,7 +41,7 @@ import ui
 from .dataRecovery import NewerFormatVersion
 from .webModule import InvalidApiVersion, WebModule, WebModuleDataLayer
 from ..lib.packaging import version
-from ..overlay import WebAccessBmdti
+from ..overlay import WebAccessBmdti, WebAccessObject
 from ..store import DuplicateRefError
 from ..store import MalformedRefError
 
@@ -67,7 +67,7 @@ def delete(webModule, prompt=True):
 def getCatalog(refresh=False, errors=None):
 	global _catalog, _webModules
 	if not refresh:
-		if _catalog:
+		if _catalog is not None:
 			return _catalog
 	else:
 		_webModules = None
@@ -117,7 +117,6 @@ def getWebModuleForUrl(url):
 
 
 def getWindowTitle(obj):
-	from ..overlay import WebAccessObject
 	if isinstance(obj, WebAccessObject):
 		role = obj._get_role(original=True)
 	else:
@@ -171,7 +170,7 @@ def getUrl(obj):
 def getWebModules(refresh=False, errors=None):
 	global _catalog, _webModules
 	if not refresh:
-		if _webModules:
+		if _webModules is not None:
 			return _webModules
 	else:
 		_catalog = None
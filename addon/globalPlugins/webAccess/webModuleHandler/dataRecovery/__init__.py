@@ -458,7 +458,7 @@ def recoverFrom_0_6_to_0_9(data):
 
 def recoverFrom_0_7_to_0_8(data):
 	RULE_TYPE_FIELDS = {
-		"marker": (
+		"marker": frozenset((
 			"autoAction",
 			"multiple",
 			"formMode",
@@ -467,8 +467,8 @@ def recoverFrom_0_7_to_0_8(data):
 			"customName",
 			"customValue",
 			"mutation"
-		),
-		"zone": (
+		)),
+		"zone": frozenset((
 			"autoAction",
 			"formMode",
 			"skip",
@@ -476,15 +476,15 @@ def recoverFrom_0_7_to_0_8(data):
 			"customName",
 			"customValue",
 			"mutation"
-		),
-		"pageTitle1": ("customValue"),
-		"pageTitle2": ("customValue")
+		)),
+		"pageTitle1": frozenset(("customValue",)),
+		"pageTitle2": frozenset(("customValue",))
 	}
 	validProperties = ("autoAction", "multiple", "formMode", "skip", "sayName", "customName", "customValue", "mutation")
 	rules = data.get("Rules", [])
 	for ruleData in rules.values():
 		ruleType = ruleData.get("type")
-		ruleTypeProperties = RULE_TYPE_FIELDS.get(ruleType, ())
+		ruleTypeProperties = RULE_TYPE_FIELDS.get(ruleType, frozenset())
 		newRuleProperties = {}
 		for key in validProperties:
 			if key in ruleData and key not in ruleTypeProperties: